@@ -17,7 +17,10 @@ Design Decisions:
 from flask import Flask, render_template, send_from_directory
 import os
 from database import init_database, seed_sample_data
-from routes import api
+from archive import init_archive
+from assets import init_assets
+from backup import init_backup, start_backup_scheduler
+from routes import api, build_bootstrap
 
 def create_app():
     """
@@ -35,27 +38,47 @@ def create_app():
     # Configuration
     app.config['SECRET_KEY'] = 'your-secret-key-change-in-production'  # Used for sessions, CSRF protection
     app.config['DEBUG'] = True  # Enable debug mode for development
+    app.config['BOOTSTRAP_DATA'] = True  # Embed initial data in index.html (disable to compare load times)
     
     # Initialize database
     init_database(app)
     
+    # Configure study log archiving (adds the `flask archive-logs` command)
+    init_archive(app)
+    
+    # Configure online backups (adds `flask backup` and `flask restore`)
+    init_backup(app)
+    
     # Register API routes (all routes prefixed with /api)
     app.register_blueprint(api)
     
+    # Built asset serving and JSON compression (adds `flask build-assets`)
+    init_assets(app)
+    
     # Main page route - serves our single-page application
     @app.route('/')
     def index():
         """
         Serve the main HTML page.
         
-        This is our single-page application entry point.
-        All dynamic content is loaded via JavaScript API calls.
+        This is our single-page application entry point. The initial
+        stats, skills and logs are embedded in the page so the first
+        render needs no API calls; later updates go through the API.
         """
-        return render_template('index.html')
+        bootstrap = None
+        if app.config['BOOTSTRAP_DATA']:
+            try:
+                bootstrap = build_bootstrap()
+            except Exception as e:
+                # The page still works without it, loading data via the API
+                print(f"Warning: Could not build bootstrap data: {e}")
+        
+        return render_template('index.html', bootstrap=bootstrap)
     
     # Static file serving (handled automatically by Flask, but documented here)
     # CSS files: /static/css/styles.css
     # JS files: /static/js/main.js
+    # Built assets (after `flask build-assets`): /assets/<name>.<hash>.<ext>
     
     # Health check endpoint for monitoring
     @app.route('/health')
@@ -94,6 +117,11 @@ if __name__ == '__main__':
     # Add sample data on first run
     initialize_sample_data(app)
     
+    # Scheduled backups run in the serving process only; with the reloader,
+    # that's the child (the parent just watches files and restarts it)
+    if app.config['BACKUP_INTERVAL_MINUTES'] and os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
+        start_backup_scheduler(app)
+    
     # Run the development server
     print("Starting Skill Tracker application...")
     print("Visit: http://localhost:6969")
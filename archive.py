@@ -0,0 +1,552 @@
+"""
+Hot/cold archival of old study logs for the Skill Tracker app.
+
+This module handles:
+- Moving study logs older than a configurable horizon into per-year
+  archive SQLite files (archive/study_log_<year>.db)
+- Reading those archives on demand so reads that reach back in time
+  transparently include archived logs
+- The `flask archive-logs` CLI command that runs the archival job
+
+Design Decisions:
+- One archive file per year keeps each file small and lets queries attach
+  only the years their date range covers
+- Archives are plain SQLite files with the same study_log and
+  study_skill_association tables. Reads open them with their own read-only
+  connections; writes ATTACH one archive at a time
+- Skills are never archived; archived logs reference skills in the hot database
+- archive/archive.json records the newest archived date and the highest
+  archived log and skill ids. Reads only open archives when a page reaches
+  back past that date, and new study logs and skills get ids above those
+  (both tables use AUTOINCREMENT and their sequences are moved past them),
+  so archived links never point at a different log or skill
+- The horizon must cover at least a month so the dashboard stats (week,
+  month, last 7 days) are always answered by the hot database alone
+"""
+
+import json
+import os
+import re
+import sqlite3
+from contextlib import contextmanager
+from datetime import date, datetime, time, timedelta
+
+import click
+from flask import current_app
+from catalog import serialize_logs, skills_by_log
+from models import db, StudyLog
+
+DEFAULT_HORIZON_DAYS = 365
+MIN_HORIZON_DAYS = 31  # Longest window used by /api/stats (current month)
+
+ARCHIVE_FILE_PATTERN = re.compile(r'^study_log_(\d{4})\.db$')
+METADATA_FILENAME = 'archive.json'
+
+ARCHIVE_SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS {schema}.study_log (
+        id INTEGER PRIMARY KEY,
+        date DATETIME NOT NULL,
+        hours FLOAT NOT NULL,
+        notes TEXT,
+        created_at DATETIME NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS {schema}.ix_study_log_date ON study_log (date)",
+    """
+    CREATE TABLE IF NOT EXISTS {schema}.study_skill_association (
+        study_log_id INTEGER NOT NULL,
+        skill_id INTEGER NOT NULL,
+        PRIMARY KEY (study_log_id, skill_id)
+    )
+    """,
+]
+
+def init_archive(app):
+    """
+    Configure archive settings and register the archival CLI command.
+
+    Args:
+        app: Flask application instance
+    """
+    basedir = os.path.abspath(os.path.dirname(__file__))
+    app.config.setdefault('ARCHIVE_DIR', os.path.join(basedir, 'archive'))
+    app.config.setdefault('ARCHIVE_HORIZON_DAYS', DEFAULT_HORIZON_DAYS)
+
+    @app.cli.command('archive-logs')
+    @click.option('--horizon-days', type=int, default=None,
+                  help='Archive logs older than this many days (default: ARCHIVE_HORIZON_DAYS).')
+    @click.option('--no-vacuum', is_flag=True, help='Skip compacting the hot database afterwards.')
+    def archive_logs_command(horizon_days, no_vacuum):
+        """Move old study logs into per-year archive databases."""
+        moved = archive_study_logs(app, horizon_days, vacuum=not no_vacuum)
+        if not moved:
+            print("No study logs older than the horizon. Nothing archived.")
+        for year, count in sorted(moved.items()):
+            print(f"Archived {count} study log(s) into {archive_path(app, year)}")
+
+    # Archives may predate the metadata or the id sequences (e.g. after a restore)
+    with app.app_context():
+        reserve_all_archived_ids(app)
+
+# === ARCHIVE FILES ===
+
+def archive_path(app, year):
+    """Path of the archive database holding study logs from `year`."""
+    return os.path.join(app.config['ARCHIVE_DIR'], f'study_log_{year}.db')
+
+@contextmanager
+def read_archive(app, year):
+    """Open the archive for `year` read-only through its own sqlite3 connection."""
+    connection = sqlite3.connect(f'file:{archive_path(app, year)}?mode=ro', uri=True)
+    try:
+        yield connection
+    finally:
+        connection.close()
+
+def archive_years(app, date_from=None, date_to=None):
+    """
+    List the years that have an archive file, oldest first.
+
+    Args:
+        app: Flask application instance
+        date_from: Optional date; skip archives entirely before it
+        date_to: Optional date; skip archives entirely after it
+    """
+    archive_dir = app.config['ARCHIVE_DIR']
+    if not os.path.isdir(archive_dir):
+        return []
+
+    years = []
+    for filename in os.listdir(archive_dir):
+        match = ARCHIVE_FILE_PATTERN.match(filename)
+        if match:
+            years.append(int(match.group(1)))
+
+    if date_from:
+        years = [year for year in years if year >= date_from.year]
+    if date_to:
+        years = [year for year in years if year <= date_to.year]
+
+    return sorted(years)
+
+# === ARCHIVE METADATA ===
+
+_metadata_cache = {}  # path -> (mtime, metadata)
+
+METADATA_FIELDS = ('newest_date', 'max_id', 'max_skill_id')
+
+def metadata_path(app):
+    """Path of the archive metadata file."""
+    return os.path.join(app.config['ARCHIVE_DIR'], METADATA_FILENAME)
+
+def archive_metadata(app):
+    """
+    Get the newest archived log date and the highest archived log and skill ids.
+
+    Read from archive.json (cached until the file changes). When archives
+    exist without the file, or the file is missing a field, the values are
+    computed from the archive files once and the file is written.
+
+    Returns:
+        Dict with 'newest_date' (datetime or None), 'max_id' and
+        'max_skill_id' (int or None)
+    """
+    path = metadata_path(app)
+    metadata = _read_metadata(path)
+    if metadata is None:
+        years = archive_years(app)
+        if not years:
+            return dict.fromkeys(METADATA_FIELDS)
+        write_archive_metadata(app, *_scan_archives(app, years))
+        metadata = _read_metadata(path)
+    return metadata
+
+def _read_metadata(path):
+    """Parse archive.json, or None if it is missing or lacks a field."""
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+    cached = _metadata_cache.get(path)
+    if cached and cached[0] == mtime:
+        return cached[1]
+
+    with open(path) as f:
+        data = json.load(f)
+    if any(field not in data for field in METADATA_FIELDS):
+        return None
+
+    metadata = {
+        'newest_date': datetime.fromisoformat(data['newest_date']) if data['newest_date'] else None,
+        'max_id': data['max_id'],
+        'max_skill_id': data['max_skill_id']
+    }
+    _metadata_cache[path] = (mtime, metadata)
+    return metadata
+
+def write_archive_metadata(app, newest_date, max_id, max_skill_id):
+    """
+    Record the newest archived date and the highest archived log and skill ids.
+
+    Values only ever grow, so the metadata stays an upper bound even after
+    archived logs are deleted.
+    """
+    path = metadata_path(app)
+    values = {'newest_date': newest_date, 'max_id': max_id, 'max_skill_id': max_skill_id}
+
+    try:
+        with open(path) as f:
+            current = json.load(f)
+    except FileNotFoundError:
+        current = {}
+    if current.get('newest_date'):
+        current['newest_date'] = datetime.fromisoformat(current['newest_date'])
+
+    for field in METADATA_FIELDS:
+        if current.get(field) is not None and (values[field] is None or current[field] > values[field]):
+            values[field] = current[field]
+
+    if values['newest_date']:
+        values['newest_date'] = values['newest_date'].isoformat()
+
+    temporary = path + '.partial'
+    with open(temporary, 'w') as f:
+        json.dump(values, f)
+    os.replace(temporary, path)
+
+def _scan_archives(app, years):
+    """Compute the newest date and highest log and skill ids across archive files."""
+    newest_date, max_id, max_skill_id = None, None, None
+    for year in years:
+        with read_archive(app, year) as connection:
+            year_date, year_id = connection.execute('SELECT MAX(date), MAX(id) FROM study_log').fetchone()
+            year_skill_id = connection.execute('SELECT MAX(skill_id) FROM study_skill_association').fetchone()[0]
+        if year_date and (newest_date is None or datetime.fromisoformat(year_date) > newest_date):
+            newest_date = datetime.fromisoformat(year_date)
+        if year_id and (max_id is None or year_id > max_id):
+            max_id = year_id
+        if year_skill_id and (max_skill_id is None or year_skill_id > max_skill_id):
+            max_skill_id = year_skill_id
+    return newest_date, max_id, max_skill_id
+
+def reserve_archived_ids(connection, table, max_id):
+    """
+    Move the id sequence of `table` past `max_id` so archived ids aren't reused.
+
+    Archived logs keep their ids and the ids of their skills, so both
+    study_log and skill ids must stay unique across hot and archived data.
+    """
+    updated = connection.exec_driver_sql(
+        "UPDATE sqlite_sequence SET seq = MAX(seq, ?) WHERE name = ?", (max_id, table)
+    ).rowcount
+    if not updated:
+        connection.exec_driver_sql("INSERT INTO sqlite_sequence (name, seq) VALUES (?, ?)", (table, max_id))
+
+def reserve_all_archived_ids(app):
+    """Reserve the archived log and skill ids recorded in the metadata."""
+    metadata = archive_metadata(app)
+    with db.engine.begin() as connection:
+        if metadata['max_id']:
+            reserve_archived_ids(connection, 'study_log', metadata['max_id'])
+        if metadata['max_skill_id']:
+            reserve_archived_ids(connection, 'skill', metadata['max_skill_id'])
+
+@contextmanager
+def attached_archives(connection, app, years):
+    """
+    ATTACH the archives for `years` to `connection` as archive_<year>.
+
+    Archives this call attaches are DETACHed again on exit, so pooled
+    connections never keep them. Archives that are already attached are
+    reused and left alone. SQLite allows 10 attached databases per
+    connection by default, so callers attach one year at a time.
+
+    Yields:
+        List of schema names, in the same order as `years`
+    """
+    already_attached = {row[1] for row in connection.exec_driver_sql('PRAGMA database_list')}
+    attached = []
+    try:
+        for year in years:
+            if f'archive_{year}' in already_attached:
+                continue
+            connection.exec_driver_sql(f'ATTACH DATABASE ? AS archive_{year}', (archive_path(app, year),))
+            attached.append(year)
+        yield [f'archive_{year}' for year in years]
+    finally:
+        for year in attached:
+            connection.exec_driver_sql(f'DETACH DATABASE archive_{year}')
+
+# === ARCHIVAL JOB ===
+
+def archive_study_logs(app, horizon_days=None, vacuum=True):
+    """
+    Move study logs older than the horizon into per-year archive databases.
+
+    Each year is moved in its own transaction: logs and their skill links are
+    copied into the archive and deleted from the hot database atomically.
+    The metadata is written before each commit, so it never understates
+    what has been archived.
+
+    Args:
+        app: Flask application instance
+        horizon_days: Keep logs from the last N days hot (default: ARCHIVE_HORIZON_DAYS)
+        vacuum: Compact the hot database afterwards so it stays small
+
+    Returns:
+        Dict mapping year to the number of logs archived
+    """
+    horizon_days = horizon_days or app.config['ARCHIVE_HORIZON_DAYS']
+    if horizon_days < MIN_HORIZON_DAYS:
+        raise ValueError(f'Archive horizon must be at least {MIN_HORIZON_DAYS} days')
+
+    cutoff = datetime.combine(date.today() - timedelta(days=horizon_days), time.min)
+    moved = {}
+
+    with app.app_context():
+        os.makedirs(app.config['ARCHIVE_DIR'], exist_ok=True)
+
+        with db.engine.connect() as connection:
+            condition = "date < ? AND strftime('%Y', date) = ?"
+
+            years = [int(row[0]) for row in connection.exec_driver_sql(
+                "SELECT DISTINCT strftime('%Y', date) FROM study_log WHERE date < ?",
+                (str(cutoff),)
+            )]
+
+            for year in years:
+                params = (str(cutoff), str(year))
+
+                with attached_archives(connection, app, [year]) as (schema,):
+                    try:
+                        for statement in ARCHIVE_SCHEMA:
+                            connection.exec_driver_sql(statement.format(schema=schema))
+
+                        moved[year] = connection.exec_driver_sql(
+                            f"INSERT INTO {schema}.study_log (id, date, hours, notes, created_at) "
+                            f"SELECT id, date, hours, notes, created_at FROM main.study_log WHERE {condition}",
+                            params
+                        ).rowcount
+                        connection.exec_driver_sql(
+                            f"INSERT INTO {schema}.study_skill_association (study_log_id, skill_id) "
+                            f"SELECT study_log_id, skill_id FROM main.study_skill_association "
+                            f"WHERE study_log_id IN (SELECT id FROM main.study_log WHERE {condition})",
+                            params
+                        )
+                        connection.exec_driver_sql(
+                            f"DELETE FROM main.study_skill_association "
+                            f"WHERE study_log_id IN (SELECT id FROM main.study_log WHERE {condition})",
+                            params
+                        )
+                        newest_date, max_id = connection.exec_driver_sql(
+                            f"SELECT MAX(date), MAX(id) FROM main.study_log WHERE {condition}", params
+                        ).one()
+                        max_skill_id = connection.exec_driver_sql(
+                            f"SELECT MAX(skill_id) FROM {schema}.study_skill_association"
+                        ).scalar()
+                        connection.exec_driver_sql(f"DELETE FROM main.study_log WHERE {condition}", params)
+                        reserve_archived_ids(connection, 'study_log', max_id)
+                        if max_skill_id:
+                            reserve_archived_ids(connection, 'skill', max_skill_id)
+                        write_archive_metadata(app, datetime.fromisoformat(newest_date), max_id, max_skill_id)
+                        connection.commit()
+                    except Exception:
+                        connection.rollback()
+                        raise
+
+            if vacuum and moved:
+                connection.exec_driver_sql('VACUUM')
+
+    return moved
+
+# === READS ACROSS HOT AND ARCHIVED LOGS ===
+
+def query_study_logs(date_from=None, date_to=None, limit=50, offset=0):
+    """
+    Get study logs as dicts, most recent first, including archived logs.
+
+    The hot table is queried first. Archives are only read when the
+    requested page could contain archived logs, i.e. when it reaches back
+    to the newest archived date (see archive_metadata). They are then read
+    newest year first, each through its own read-only connection, so any
+    number of archive years works and the request's connection (and its
+    transaction, see /api/batch) is left alone.
+
+    Args:
+        date_from: Optional start date (inclusive)
+        date_to: Optional end date
+        limit: Maximum number of logs to return
+        offset: Number of logs to skip
+
+    Returns:
+        List of dicts in the StudyLog.to_dict format
+    """
+    query = StudyLog.query
+    if date_from:
+        query = query.filter(StudyLog.date >= date_from)
+    if date_to:
+        query = query.filter(StudyLog.date <= date_to)
+
+    hot_logs = query.order_by(StudyLog.date.desc()).limit(limit).offset(offset).all()
+
+    years = archive_years(current_app, date_from, date_to)
+    if not years:
+        return serialize_logs(hot_logs)
+
+    # No archived log is newer than the newest archived date
+    newest_archived = archive_metadata(current_app)['newest_date']
+    if newest_archived is None or (date_from and datetime.combine(date_from, time.min) > newest_archived):
+        return serialize_logs(hot_logs)
+    if len(hot_logs) == limit and hot_logs[-1].date > newest_archived:
+        return serialize_logs(hot_logs)
+
+    conditions, params = [], []
+    if date_from:
+        conditions.append('date >= ?')
+        params.append(date_from.isoformat())
+    if date_to:
+        conditions.append('date <= ?')
+        params.append(date_to.isoformat())
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ''
+
+    # Candidates for the page: the newest offset + limit logs of the hot table
+    # and of each archive. Archive years don't overlap, so older years are
+    # skipped once they can no longer reach the page.
+    wanted = offset + limit
+    candidates = [
+        (log_date, 'main', log_id)
+        for log_id, log_date in query.with_entities(StudyLog.id, StudyLog.date)
+                                     .order_by(StudyLog.date.desc()).limit(wanted)
+    ]
+    for year in reversed(years):
+        if len(candidates) >= wanted:
+            candidates.sort(key=lambda candidate: candidate[0], reverse=True)
+            if candidates[wanted - 1][0] >= datetime(year + 1, 1, 1):
+                break
+        with read_archive(current_app, year) as connection:
+            rows = connection.execute(
+                f'SELECT id, date FROM study_log {where} ORDER BY date DESC LIMIT ?',
+                tuple(params) + (wanted,)
+            ).fetchall()
+        candidates.extend((datetime.fromisoformat(log_date), year, log_id) for log_id, log_date in rows)
+
+    candidates.sort(key=lambda candidate: candidate[0], reverse=True)
+    page = candidates[offset:wanted]
+
+    ids_by_source = {}
+    for _, source, log_id in page:
+        ids_by_source.setdefault(source, []).append(log_id)
+
+    logs_by_key = {}
+    hot_ids = ids_by_source.pop('main', [])
+    if hot_ids:
+        for log in serialize_logs(StudyLog.query.filter(StudyLog.id.in_(hot_ids)).all()):
+            logs_by_key[('main', log['id'])] = log
+
+    for year, ids in ids_by_source.items():
+        for log in _archived_log_dicts(current_app, year, ids):
+            logs_by_key[(year, log['id'])] = log
+
+    return [logs_by_key[(source, log_id)] for _, source, log_id in page]
+
+def _archived_log_dicts(app, year, ids):
+    """Load archived logs from one archive in the StudyLog.to_dict format."""
+    placeholders = ', '.join('?' for _ in ids)
+
+    with read_archive(app, year) as connection:
+        log_rows = connection.execute(
+            f'SELECT id, date, hours, notes, created_at FROM study_log WHERE id IN ({placeholders})',
+            tuple(ids)
+        ).fetchall()
+        link_rows = connection.execute(
+            f'SELECT study_log_id, skill_id FROM study_skill_association '
+            f'WHERE study_log_id IN ({placeholders})',
+            tuple(ids)
+        ).fetchall()
+
+    # Skills deleted since archiving drop out of the log's skill list; skill
+    # ids are never reused (see reserve_archived_ids), so links can't resolve
+    # to a different skill
+    skills = skills_by_log(link_rows)
+
+    return [{
+        'id': log_id,
+        'date': datetime.fromisoformat(log_date).isoformat(),
+        'hours': hours,
+        'notes': notes,
+        'skills': skills.get(log_id, []),
+        'created_at': datetime.fromisoformat(created_at).isoformat()
+    } for log_id, log_date, hours, notes, created_at in log_rows]
+
+def archived_study_days():
+    """
+    Get the distinct days with archived study activity, most recent first.
+
+    Used to continue a daily streak that runs past the archive horizon.
+    """
+    days = []
+    for year in reversed(archive_years(current_app)):
+        with read_archive(current_app, year) as connection:
+            rows = connection.execute(
+                'SELECT DISTINCT date(date) AS day FROM study_log ORDER BY day DESC'
+            ).fetchall()
+        days.extend(date.fromisoformat(row[0]) for row in rows)
+    return days
+
+def drop_archived_duplicates(app):
+    """
+    Delete hot study logs that also exist in an archive.
+
+    A snapshot of tracker.db taken before an archival run still contains
+    the logs that were archived since. After restoring it, this removes
+    them from the hot database again and moves the id sequences back past
+    the archived ids.
+
+    Returns:
+        Number of study logs removed from the hot database
+    """
+    removed = 0
+    with app.app_context():
+        with db.engine.connect() as connection:
+            for year in archive_years(app):
+                with attached_archives(connection, app, [year]) as (schema,):
+                    try:
+                        connection.exec_driver_sql(
+                            f"DELETE FROM main.study_skill_association "
+                            f"WHERE study_log_id IN (SELECT id FROM {schema}.study_log)"
+                        )
+                        removed += connection.exec_driver_sql(
+                            f"DELETE FROM main.study_log WHERE id IN (SELECT id FROM {schema}.study_log)"
+                        ).rowcount
+                        connection.commit()
+                    except Exception:
+                        connection.rollback()
+                        raise
+
+        reserve_all_archived_ids(app)
+
+    return removed
+
+def delete_archived_study_log(log_id):
+    """
+    Delete a study log from whichever archive holds it.
+
+    Returns:
+        True if the log was found and deleted, False otherwise
+    """
+    with db.engine.connect() as connection:
+        for year in reversed(archive_years(current_app)):
+            with attached_archives(connection, current_app, [year]) as (schema,):
+                deleted = connection.exec_driver_sql(
+                    f'DELETE FROM {schema}.study_log WHERE id = ?', (log_id,)
+                ).rowcount
+                if deleted:
+                    connection.exec_driver_sql(
+                        f'DELETE FROM {schema}.study_skill_association WHERE study_log_id = ?', (log_id,)
+                    )
+                    connection.commit()
+                    return True
+                connection.rollback()
+    return False
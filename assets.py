@@ -0,0 +1,171 @@
+"""
+Static asset pipeline and response compression for the Skill Tracker app.
+
+This module handles:
+- The `flask build-assets` CLI command: minifies CSS/JS, fingerprints file
+  names with a content hash and writes gzip/brotli variants to static/dist
+- Serving built assets from /assets with far-future immutable cache headers,
+  picking the precompressed variant the client accepts
+- The `asset_url()` template helper that resolves hashed file names
+- Negotiated gzip compression of large JSON responses
+
+Design Decisions:
+- Content-hashed names mean a file never changes once deployed, so browsers
+  can cache it forever and a deploy only downloads what actually changed
+- Compression happens once at build time instead of on every request
+- Without a build (plain `python app.py`), templates fall back to the
+  unminified files under /static so development needs no extra step
+- Build-only dependencies (rcssmin, rjsmin, brotli) are imported inside the
+  build so serving never requires them
+"""
+
+import gzip
+import hashlib
+import json
+import mimetypes
+import os
+import shutil
+
+from flask import request, send_from_directory, url_for
+
+# Source files (relative to static/) that go through the pipeline
+ASSETS = [
+    'css/styles.css',
+    'js/validation.js',
+    'js/main.js',
+]
+
+DIST_DIRNAME = 'dist'
+MANIFEST_FILENAME = 'manifest.json'
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+
+# Smaller JSON bodies aren't worth the CPU or the extra header bytes
+JSON_COMPRESSION_MIN_SIZE = 1024
+
+def init_assets(app):
+    """
+    Register asset serving, the template helper, JSON compression and the
+    build command.
+
+    Args:
+        app: Flask application instance
+    """
+    dist_dir = os.path.join(app.static_folder, DIST_DIRNAME)
+    manifest = load_manifest(dist_dir)
+
+    @app.template_global()
+    def asset_url(filename):
+        """URL of the built (hashed) asset, or the source file if not built."""
+        if filename in manifest:
+            return url_for('serve_asset', filename=manifest[filename])
+        return url_for('static', filename=filename)
+
+    @app.route('/assets/<path:filename>')
+    def serve_asset(filename):
+        """Serve a fingerprinted asset, precompressed when the client accepts it."""
+        mimetype = mimetypes.guess_type(filename)[0]
+
+        for encoding, suffix in (('br', '.br'), ('gzip', '.gz')):
+            if request.accept_encodings[encoding] and os.path.isfile(os.path.join(dist_dir, filename + suffix)):
+                response = send_from_directory(dist_dir, filename + suffix, mimetype=mimetype)
+                response.headers['Content-Encoding'] = encoding
+                break
+        else:
+            response = send_from_directory(dist_dir, filename, mimetype=mimetype)
+
+        response.headers['Cache-Control'] = IMMUTABLE_CACHE_CONTROL
+        response.vary.add('Accept-Encoding')
+        return response
+
+    @app.after_request
+    def compress_json_response(response):
+        """Gzip large JSON responses for clients that accept it."""
+        if (response.mimetype != 'application/json'
+                or response.direct_passthrough
+                or 'Content-Encoding' in response.headers
+                or not request.accept_encodings['gzip']):
+            return response
+
+        data = response.get_data()
+        if len(data) < JSON_COMPRESSION_MIN_SIZE:
+            return response
+
+        response.set_data(gzip.compress(data, compresslevel=6))
+        response.headers['Content-Encoding'] = 'gzip'
+        response.vary.add('Accept-Encoding')
+        return response
+
+    @app.cli.command('build-assets')
+    def build_assets_command():
+        """Minify, fingerprint and precompress the static assets."""
+        built = build_assets(app.static_folder)
+        for source, target in built.items():
+            print(f"{source} -> {DIST_DIRNAME}/{target}")
+        print(f"Built {len(built)} asset(s). Restart the app to serve them.")
+
+def load_manifest(dist_dir):
+    """
+    Load the source-to-hashed-name mapping written by the last build.
+
+    Returns:
+        Dict mapping source paths to built paths (empty if never built)
+    """
+    try:
+        with open(os.path.join(dist_dir, MANIFEST_FILENAME), encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+def build_assets(static_folder):
+    """
+    Build every file in ASSETS into static/dist.
+
+    For each source file this writes the minified `<name>.<hash>.<ext>` plus
+    `.gz` and `.br` variants, then records the mapping in manifest.json.
+    Previous builds are removed first.
+
+    Args:
+        static_folder: Path of the app's static folder
+
+    Returns:
+        Dict mapping source paths to built paths
+    """
+    import brotli
+    import rcssmin
+    import rjsmin
+
+    minifiers = {
+        '.css': rcssmin.cssmin,
+        '.js': rjsmin.jsmin,
+    }
+
+    dist_dir = os.path.join(static_folder, DIST_DIRNAME)
+    shutil.rmtree(dist_dir, ignore_errors=True)
+
+    manifest = {}
+    for source in ASSETS:
+        with open(os.path.join(static_folder, source), encoding='utf-8') as f:
+            text = f.read()
+
+        root, ext = os.path.splitext(source)
+        data = minifiers[ext](text).encode('utf-8')
+        digest = hashlib.sha256(data).hexdigest()[:12]
+        target = f'{root}.{digest}{ext}'
+
+        target_path = os.path.join(dist_dir, target)
+        os.makedirs(os.path.dirname(target_path), exist_ok=True)
+
+        with open(target_path, 'wb') as f:
+            f.write(data)
+        # mtime=0 keeps the gzip output identical across builds of the same content
+        with open(target_path + '.gz', 'wb') as f:
+            f.write(gzip.compress(data, compresslevel=9, mtime=0))
+        with open(target_path + '.br', 'wb') as f:
+            f.write(brotli.compress(data, quality=11))
+
+        manifest[source] = target
+
+    with open(os.path.join(dist_dir, MANIFEST_FILENAME), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+
+    return manifest
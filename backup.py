@@ -0,0 +1,311 @@
+"""
+Online backup and snapshot restore for the Skill Tracker app.
+
+This module handles:
+- Consistent snapshots of tracker.db taken with SQLite's online backup API
+  while the app keeps serving requests
+- Retention of the most recent snapshots and optional scheduled backups
+- Restoring a snapshot into the live database
+- The `flask backup` and `flask restore` CLI commands
+
+Design Decisions:
+- The backup copies a bounded number of pages per step and pauses between
+  steps, so API requests get the database in between instead of waiting
+  for one long copy
+- Snapshots are written to a temporary file and renamed into place, so a
+  snapshot file is always complete
+- Restore uses the same backup API in the other direction, copying the
+  snapshot into the live file in a single step
+- Archive databases (archive.py) are separate files and are not included.
+  Logs archived after a snapshot was taken are removed from the restored
+  database again, so they are never both hot and archived
+- Restore replaces the database underneath any running app process, so the
+  server must be stopped while it runs
+"""
+
+import os
+import sqlite3
+import statistics
+import threading
+import time
+from datetime import datetime
+
+import click
+from archive import drop_archived_duplicates
+from models import db
+
+SNAPSHOT_PREFIX = 'tracker-'
+SAFETY_PREFIX = 'pre-restore-'  # Not listed as a snapshot, never removed by retention
+SNAPSHOT_SUFFIX = '.db'
+
+def init_backup(app):
+    """
+    Configure backup settings and register the CLI commands.
+
+    Scheduled backups are not started here, since the factory also runs in
+    CLI commands and the reloader's watcher process; the serving process
+    starts them with start_backup_scheduler (see app.py).
+
+    Args:
+        app: Flask application instance
+    """
+    basedir = os.path.abspath(os.path.dirname(__file__))
+    app.config.setdefault('BACKUP_DIR', os.path.join(basedir, 'backups'))
+    app.config.setdefault('BACKUP_RETENTION', 7)            # Snapshots to keep
+    app.config.setdefault('BACKUP_PAGES_PER_STEP', 256)     # Pages copied per step
+    app.config.setdefault('BACKUP_STEP_PAUSE', 0.005)       # Seconds to yield between steps
+    app.config.setdefault('BACKUP_INTERVAL_MINUTES', 0)     # 0 disables scheduled backups
+
+    @app.cli.command('backup')
+    @click.option('--pages', type=int, default=None, help='Pages copied per step (default: BACKUP_PAGES_PER_STEP).')
+    @click.option('--pause', type=float, default=None, help='Seconds to pause between steps (default: BACKUP_STEP_PAUSE).')
+    @click.option('--measure-latency', is_flag=True, help='Time GET /api/stats before and during the backup.')
+    def backup_command(pages, pause, measure_latency):
+        """Take an online snapshot of the database."""
+        if measure_latency:
+            result, latency = measure_backup_latency(app, pages_per_step=pages, step_pause=pause)
+        else:
+            result, latency = backup_database(app, pages_per_step=pages, step_pause=pause), None
+
+        print(f"Snapshot written to {result['path']}")
+        print(f"Copied {result['pages']} pages in {result['steps']} steps "
+              f"({result['seconds']:.3f}s, {result['pages_per_second']:.0f} pages/sec)")
+        if latency:
+            print(f"GET /api/stats latency: idle p50 {latency['idle']['p50_ms']:.2f}ms "
+                  f"p95 {latency['idle']['p95_ms']:.2f}ms, during backup p50 "
+                  f"{latency['during_backup']['p50_ms']:.2f}ms p95 {latency['during_backup']['p95_ms']:.2f}ms")
+        for path in result['removed']:
+            print(f"Removed old snapshot {path}")
+
+    @app.cli.command('restore')
+    @click.argument('snapshot', required=False)
+    @click.option('--no-safety-backup', is_flag=True, help='Skip snapshotting the current database first.')
+    def restore_command(snapshot, no_safety_backup):
+        """Restore the database from SNAPSHOT (default: the latest snapshot). Stop the server first."""
+        restored, removed = restore_database(app, snapshot, safety_backup=not no_safety_backup)
+        print(f"Database restored from {restored}")
+        if removed:
+            print(f"Removed {removed} study log(s) that have been archived since the snapshot")
+
+# === SNAPSHOTS ===
+
+def database_path(app):
+    """Filesystem path of the live SQLite database."""
+    with app.app_context():
+        return db.engine.url.database
+
+def list_snapshots(app):
+    """List snapshot paths in the backup directory, oldest first."""
+    backup_dir = app.config['BACKUP_DIR']
+    if not os.path.isdir(backup_dir):
+        return []
+
+    # Timestamped names sort chronologically
+    return [
+        os.path.join(backup_dir, filename)
+        for filename in sorted(os.listdir(backup_dir))
+        if filename.startswith(SNAPSHOT_PREFIX) and filename.endswith(SNAPSHOT_SUFFIX)
+    ]
+
+def snapshot_path(app, prefix):
+    """New timestamped file path in BACKUP_DIR."""
+    os.makedirs(app.config['BACKUP_DIR'], exist_ok=True)
+    timestamp = datetime.now().strftime('%Y%m%d-%H%M%S-%f')
+    return os.path.join(app.config['BACKUP_DIR'], f'{prefix}{timestamp}{SNAPSHOT_SUFFIX}')
+
+def backup_database(app, destination=None, pages_per_step=None, step_pause=None, retention=None):
+    """
+    Copy the live database to a snapshot using SQLite's online backup API.
+
+    Writers are never blocked for the whole copy: each step copies at most
+    `pages_per_step` pages and then sleeps `step_pause` seconds. If another
+    connection writes to the database mid-copy, SQLite restarts the copy, so
+    the snapshot is always consistent.
+
+    Args:
+        app: Flask application instance
+        destination: Snapshot path (default: timestamped file in BACKUP_DIR)
+        pages_per_step: Pages per step (default: BACKUP_PAGES_PER_STEP)
+        step_pause: Pause between steps in seconds (default: BACKUP_STEP_PAUSE)
+        retention: Snapshots to keep afterwards (default: BACKUP_RETENTION)
+
+    Returns:
+        Dict with the snapshot path, pages copied, steps, seconds,
+        pages_per_second and the snapshots removed by retention
+    """
+    pages_per_step = pages_per_step or app.config['BACKUP_PAGES_PER_STEP']
+    step_pause = app.config['BACKUP_STEP_PAUSE'] if step_pause is None else step_pause
+    retention = app.config['BACKUP_RETENTION'] if retention is None else retention
+
+    if destination is None:
+        destination = snapshot_path(app, SNAPSHOT_PREFIX)
+
+    progress = {'steps': 0, 'pages': 0}
+
+    def on_step(status, remaining, total):
+        progress['steps'] += 1
+        progress['pages'] = total
+        if remaining and step_pause:
+            time.sleep(step_pause)  # Let other connections get at the database
+
+    temporary = destination + '.partial'
+    source = sqlite3.connect(database_path(app))
+    target = sqlite3.connect(temporary)
+    started = time.perf_counter()
+    try:
+        source.backup(target, pages=pages_per_step, progress=on_step)
+    finally:
+        target.close()
+        source.close()
+    seconds = time.perf_counter() - started
+
+    os.replace(temporary, destination)
+
+    removed = []
+    if retention:
+        snapshots = list_snapshots(app)
+        for path in snapshots[:-retention]:
+            os.remove(path)
+            removed.append(path)
+
+    return {
+        'path': destination,
+        'pages': progress['pages'],
+        'steps': progress['steps'],
+        'seconds': seconds,
+        'pages_per_second': progress['pages'] / seconds if seconds else 0.0,
+        'removed': removed
+    }
+
+def restore_database(app, snapshot=None, safety_backup=True):
+    """
+    Replace the live database contents with a snapshot.
+
+    The snapshot is checked first, pooled connections are closed, and the
+    pages are copied into the live file in one step while holding its lock.
+    Afterwards, logs that have been archived since the snapshot are removed
+    from it and the id sequences are moved past the archived ids (see
+    archive.drop_archived_duplicates).
+
+    The server must be stopped: a running process keeps cached data and
+    would not see the restored id sequences.
+
+    Args:
+        app: Flask application instance
+        snapshot: Snapshot path or file name in BACKUP_DIR (default: latest)
+        safety_backup: Copy the current database to pre-restore-<timestamp>.db
+            in BACKUP_DIR before overwriting it
+
+    Returns:
+        Tuple of (path of the snapshot that was restored, number of
+        archived study logs removed from the restored database)
+    """
+    if snapshot is None:
+        snapshots = list_snapshots(app)
+        if not snapshots:
+            raise FileNotFoundError(f"No snapshots in {app.config['BACKUP_DIR']}")
+        snapshot = snapshots[-1]
+    elif not os.path.isfile(snapshot):
+        snapshot = os.path.join(app.config['BACKUP_DIR'], snapshot)
+
+    source = sqlite3.connect(f'file:{snapshot}?mode=ro', uri=True)
+    try:
+        result = source.execute('PRAGMA quick_check').fetchone()[0]
+        if result != 'ok':
+            raise ValueError(f'Snapshot {snapshot} failed integrity check: {result}')
+
+        if safety_backup:
+            backup_database(app, destination=snapshot_path(app, SAFETY_PREFIX), retention=0)
+
+        with app.app_context():
+            db.session.remove()
+            db.engine.dispose()
+
+        target = sqlite3.connect(database_path(app))
+        try:
+            source.backup(target)
+        finally:
+            target.close()
+    finally:
+        source.close()
+
+    removed = drop_archived_duplicates(app)
+
+    return snapshot, removed
+
+def start_backup_scheduler(app):
+    """
+    Take a snapshot every BACKUP_INTERVAL_MINUTES in a background thread.
+
+    Returns:
+        The daemon thread running the schedule
+    """
+    interval = app.config['BACKUP_INTERVAL_MINUTES'] * 60
+
+    def run():
+        while True:
+            time.sleep(interval)
+            try:
+                backup_database(app)
+            except Exception as e:
+                print(f"Warning: Scheduled backup failed: {e}")
+
+    thread = threading.Thread(target=run, name='backup-scheduler', daemon=True)
+    thread.start()
+    return thread
+
+# === LATENCY MEASUREMENT ===
+
+def measure_backup_latency(app, samples=50, **backup_options):
+    """
+    Measure GET /api/stats latency while idle and while a backup runs.
+
+    Args:
+        app: Flask application instance
+        samples: Number of idle requests for the baseline
+        **backup_options: Passed on to backup_database
+
+    Returns:
+        Tuple of (backup result, dict with 'idle' and 'during_backup'
+        latency summaries in milliseconds)
+    """
+    client = app.test_client()
+
+    def timed_request():
+        started = time.perf_counter()
+        client.get('/api/stats')
+        return (time.perf_counter() - started) * 1000
+
+    idle = [timed_request() for _ in range(samples)]
+
+    during = []
+    done = threading.Event()
+
+    def probe():
+        # At least one request, even if the backup finishes immediately
+        while True:
+            during.append(timed_request())
+            if done.is_set():
+                break
+
+    prober = threading.Thread(target=probe)
+    prober.start()
+    try:
+        result = backup_database(app, **backup_options)
+    finally:
+        done.set()
+        prober.join()
+
+    return result, {
+        'idle': summarize_latency(idle),
+        'during_backup': summarize_latency(during)
+    }
+
+def summarize_latency(timings):
+    """Summarize request timings (ms) as count, p50 and p95."""
+    ordered = sorted(timings)
+    return {
+        'count': len(ordered),
+        'p50_ms': statistics.median(ordered),
+        'p95_ms': ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    }
@@ -0,0 +1,234 @@
+"""
+In-memory skill catalog for the Skill Tracker app.
+
+This module handles:
+- A process-local copy of the skill table as compact records
+- Secondary indexes by category and status for the /api/skills filters
+- Pre-serialized JSON for every skill, so skill lists are served by
+  joining strings instead of querying and re-serializing
+- Resolving the skills of study logs from memory
+
+Design Decisions:
+- Skills are small and read-mostly, so the whole table fits in memory and
+  every page can be answered without touching SQLite
+- The catalog is an immutable snapshot tagged with a version. The version
+  lives in the database (catalog_version in models.py): skill writes in
+  routes.py bump it in the same transaction, and every read compares it
+  with one cheap SELECT, so writes from any process (another worker, a
+  restore from backup) are picked up by the next read
+"""
+
+import json
+import sys
+import threading
+
+from models import db, Skill, catalog_version, study_skill_association
+
+class SkillRecord:
+    """Compact, read-only representation of one skill."""
+
+    __slots__ = ('id', 'name', 'status', 'category', 'created_at', 'updated_at', 'json')
+
+    def __init__(self, id, name, status, category, created_at, updated_at):
+        self.id = id
+        self.name = name
+        self.status = status
+        self.category = category
+        self.created_at = created_at
+        self.updated_at = updated_at
+        self.json = json.dumps(self.to_dict(), sort_keys=True)
+
+    def to_dict(self):
+        """Same format as Skill.to_dict."""
+        return {
+            'id': self.id,
+            'name': self.name,
+            'status': self.status,
+            'category': self.category,
+            'created_at': self.created_at,
+            'updated_at': self.updated_at
+        }
+
+class CatalogSnapshot:
+    """All skills at one catalog version, with their indexes."""
+
+    __slots__ = ('version', 'skills', 'by_id', 'by_category', 'by_status')
+
+    def __init__(self, version, rows):
+        self.version = version
+
+        # Same order as the /api/skills query: category (NULL first), then creation date
+        rows = sorted(rows, key=lambda row: (row.category is not None, row.category or '', row.created_at))
+
+        self.skills = [
+            SkillRecord(row.id, row.name, row.status.value, row.category,
+                        row.created_at.isoformat(), row.updated_at.isoformat())
+            for row in rows
+        ]
+        self.by_id = {record.id: record for record in self.skills}
+        self.by_category = {}
+        self.by_status = {}
+        for record in self.skills:
+            self.by_category.setdefault(record.category, []).append(record)
+            self.by_status.setdefault(record.status, []).append(record)
+
+    def filter(self, category=None, status=None):
+        """Skills matching the filters, using the smaller index as the starting set."""
+        if category and status:
+            by_category = self.by_category.get(category, [])
+            by_status = self.by_status.get(status, [])
+            if len(by_category) <= len(by_status):
+                return [record for record in by_category if record.status == status]
+            return [record for record in by_status if record.category == category]
+        if category:
+            return self.by_category.get(category, [])
+        if status:
+            return self.by_status.get(status, [])
+        return self.skills
+
+class SkillCatalog:
+    """
+    Versioned, lazily rebuilt in-memory skill catalog.
+
+    Usage:
+        skill_catalog.filter_json(status='Learned')  # JSON array string
+        skill_catalog.bump()                         # in every skill write, before commit
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._snapshot = None
+
+    def bump(self):
+        """
+        Bump the shared version in the current transaction.
+
+        Call before committing a skill write; every process rebuilds its
+        catalog on the next read after the commit.
+        """
+        db.session.execute(
+            catalog_version.update().where(catalog_version.c.id == 1)
+            .values(version=catalog_version.c.version + 1)
+        )
+
+    def current_version(self):
+        """Read the shared version from the database."""
+        return db.session.query(catalog_version.c.version).filter(catalog_version.c.id == 1).scalar()
+
+    def snapshot(self):
+        """
+        Get the current snapshot, rebuilding it if the shared version changed.
+
+        Must be called inside an app context.
+        """
+        # Read the version before the skills: a write in between leaves a
+        # newer catalog tagged with the older version, which only causes
+        # one extra rebuild
+        version = self.current_version()
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot.version == version:
+            return snapshot
+
+        with self._lock:
+            if self._snapshot is None or self._snapshot.version != version:
+                rows = db.session.query(
+                    Skill.id, Skill.name, Skill.status, Skill.category, Skill.created_at, Skill.updated_at
+                ).all()
+                self._snapshot = CatalogSnapshot(version, rows)
+            return self._snapshot
+
+    def get(self, skill_id):
+        """Get the SkillRecord for an id, or None."""
+        return self.snapshot().by_id.get(skill_id)
+
+    def filter(self, category=None, status=None):
+        """Get SkillRecords matching the filters, in /api/skills order."""
+        return self.snapshot().filter(category, status)
+
+    def filter_json(self, category=None, status=None):
+        """Get matching skills as a JSON array, joined from pre-serialized records."""
+        return '[' + ','.join(record.json for record in self.filter(category, status)) + ']'
+
+    def status_counts(self):
+        """Get the number of skills per status value."""
+        return {status: len(records) for status, records in self.snapshot().by_status.items()}
+
+    def memory_usage(self):
+        """
+        Estimate the memory held by the current snapshot.
+
+        Returns:
+            Dict with the skill count, total bytes and bytes per 10k skills
+        """
+        snapshot = self.snapshot()
+        seen = set()
+
+        def sizeof(obj):
+            if id(obj) in seen:
+                return 0
+            seen.add(id(obj))
+            return sys.getsizeof(obj)
+
+        total = sizeof(snapshot) + sizeof(snapshot.skills) + sizeof(snapshot.by_id)
+        total += sizeof(snapshot.by_category) + sizeof(snapshot.by_status)
+        total += sum(sizeof(records) for records in snapshot.by_category.values())
+        total += sum(sizeof(records) for records in snapshot.by_status.values())
+        for record in snapshot.skills:
+            total += sizeof(record)
+            total += sum(sizeof(getattr(record, field)) for field in SkillRecord.__slots__)
+
+        count = len(snapshot.skills)
+        return {
+            'skills': count,
+            'version': snapshot.version,
+            'bytes': total,
+            'bytes_per_10k_skills': round(total / count * 10000) if count else 0
+        }
+
+# Shared by all requests of this process
+skill_catalog = SkillCatalog()
+
+def serialize_logs(logs):
+    """
+    Serialize StudyLog objects, resolving their skills from the catalog.
+
+    The skill ids of all logs are read from the association table in one
+    query; no Skill objects are loaded.
+
+    Args:
+        logs: List of StudyLog objects
+
+    Returns:
+        List of dicts in the StudyLog.to_dict format
+    """
+    if not logs:
+        return []
+
+    links = db.session.query(
+        study_skill_association.c.study_log_id, study_skill_association.c.skill_id
+    ).filter(
+        study_skill_association.c.study_log_id.in_([log.id for log in logs])
+    ).all()
+
+    skills = skills_by_log(links)
+    return [log.to_dict(skills=skills.get(log.id, [])) for log in logs]
+
+def skills_by_log(links):
+    """
+    Group (log id, skill id) pairs into skill dicts per log.
+
+    Skills missing from the catalog (deleted since) are left out.
+
+    Args:
+        links: Iterable of (study_log_id, skill_id) pairs
+
+    Returns:
+        Dict mapping log ids to lists of skill dicts
+    """
+    snapshot = skill_catalog.snapshot()
+    skills = {}
+    for log_id, skill_id in links:
+        record = snapshot.by_id.get(skill_id)
+        if record is not None:
+            skills.setdefault(log_id, []).append(record.to_dict())
+    return skills
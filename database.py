@@ -4,18 +4,158 @@ Database configuration and initialization for the Skill Tracker app.
 This module handles:
 - Database connection setup
 - Table creation
+- Upgrading tables created by older versions of the app
+- Foreign key enforcement on every SQLite connection
 - Sample data seeding for development
 
 Design Decisions:
 - SQLite for simplicity and portability (no server setup required)
 - Separate init function for clean app setup
 - Sample data helps with initial testing and demo
+- SQLite ignores foreign keys unless enabled per connection; they are
+  needed for the ON DELETE CASCADE links in models.py
+- create_all() never alters existing tables, and SQLite can't add a
+  foreign key action to one, so outdated tables are rebuilt on startup
 """
 
 import os
+from sqlalchemy import event
 from models import db, Skill, StudyLog, SkillStatus
 from datetime import datetime
 
+def enable_foreign_keys(dbapi_connection, connection_record):
+    """Turn on foreign key enforcement for a new SQLite connection."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute('PRAGMA foreign_keys=ON')
+    cursor.close()
+
+def has_cascading_links(connection):
+    """Check whether study_skill_association was created with ON DELETE CASCADE."""
+    rows = connection.exec_driver_sql('PRAGMA foreign_key_list(study_skill_association)').all()
+    # Columns: id, seq, table, from, to, on_update, on_delete, match
+    return bool(rows) and all(row[6] == 'CASCADE' for row in rows)
+
+def rebuild_links(connection):
+    """
+    Recreate study_skill_association with cascading foreign keys.
+    
+    Links to skills or study logs that no longer exist are dropped, since
+    they would violate the enforced foreign keys.
+    
+    Returns:
+        Number of links dropped
+    """
+    connection.exec_driver_sql("""
+        CREATE TABLE study_skill_association_new (
+            study_log_id INTEGER NOT NULL,
+            skill_id INTEGER NOT NULL,
+            PRIMARY KEY (study_log_id, skill_id),
+            FOREIGN KEY (study_log_id) REFERENCES study_log(id) ON DELETE CASCADE,
+            FOREIGN KEY (skill_id) REFERENCES skill(id) ON DELETE CASCADE
+        )
+    """)
+    
+    # Copy links whose skill and study log both still exist
+    connection.exec_driver_sql("""
+        INSERT OR IGNORE INTO study_skill_association_new (study_log_id, skill_id)
+        SELECT study_log_id, skill_id
+        FROM study_skill_association
+        WHERE study_log_id IN (SELECT id FROM study_log)
+          AND skill_id IN (SELECT id FROM skill)
+    """)
+    dropped = connection.exec_driver_sql('SELECT COUNT(*) FROM study_skill_association').scalar() \
+        - connection.exec_driver_sql('SELECT COUNT(*) FROM study_skill_association_new').scalar()
+    
+    connection.exec_driver_sql('DROP TABLE study_skill_association')
+    connection.exec_driver_sql('ALTER TABLE study_skill_association_new RENAME TO study_skill_association')
+    return dropped
+
+def has_autoincrement_ids(connection, table):
+    """Check whether `table` was created with AUTOINCREMENT ids."""
+    sql = connection.exec_driver_sql(
+        "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)
+    ).scalar()
+    return 'AUTOINCREMENT' in (sql or '').upper()
+
+def rebuild_skills(connection):
+    """
+    Recreate skill with AUTOINCREMENT ids, keeping every row and id.
+    
+    Copying the rows seeds the id sequence with the current highest id.
+    """
+    connection.exec_driver_sql("""
+        CREATE TABLE skill_new (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name VARCHAR(200) NOT NULL UNIQUE,
+            status VARCHAR(11) NOT NULL,
+            category VARCHAR(100),
+            created_at DATETIME NOT NULL,
+            updated_at DATETIME NOT NULL
+        )
+    """)
+    connection.exec_driver_sql("""
+        INSERT INTO skill_new (id, name, status, category, created_at, updated_at)
+        SELECT id, name, status, category, created_at, updated_at
+        FROM skill
+    """)
+    connection.exec_driver_sql('DROP TABLE skill')
+    connection.exec_driver_sql('ALTER TABLE skill_new RENAME TO skill')
+
+def rebuild_study_logs(connection):
+    """
+    Recreate study_log with AUTOINCREMENT ids, keeping every row and id.
+    
+    Copying the rows seeds the id sequence with the current highest id.
+    """
+    connection.exec_driver_sql("""
+        CREATE TABLE study_log_new (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            date DATETIME NOT NULL,
+            hours FLOAT NOT NULL,
+            notes TEXT,
+            created_at DATETIME NOT NULL
+        )
+    """)
+    connection.exec_driver_sql("""
+        INSERT INTO study_log_new (id, date, hours, notes, created_at)
+        SELECT id, date, hours, notes, created_at
+        FROM study_log
+    """)
+    connection.exec_driver_sql('DROP TABLE study_log')
+    connection.exec_driver_sql('ALTER TABLE study_log_new RENAME TO study_log')
+
+def upgrade_schema(connection):
+    """
+    Rebuild tables created by older versions of the app.
+    
+    Runs in a single transaction with foreign key enforcement off, so
+    rebuilding a table never cascades into the tables referencing it.
+    
+    Args:
+        connection: SQLAlchemy connection outside of any transaction
+    """
+    connection.exec_driver_sql('PRAGMA foreign_keys=OFF')
+    try:
+        connection.exec_driver_sql('BEGIN')
+        try:
+            if not has_autoincrement_ids(connection, 'study_log'):
+                rebuild_study_logs(connection)
+                print("Upgraded study log ids to never be reused.")
+            if not has_autoincrement_ids(connection, 'skill'):
+                rebuild_skills(connection)
+                print("Upgraded skill ids to never be reused.")
+            if not has_cascading_links(connection):
+                dropped = rebuild_links(connection)
+                print("Upgraded skill/study log links to cascade on delete.")
+                if dropped:
+                    print(f"Dropped {dropped} link(s) to skills or study logs that no longer exist.")
+            connection.commit()
+        except Exception:
+            connection.rollback()
+            raise
+    finally:
+        connection.exec_driver_sql('PRAGMA foreign_keys=ON')
+
 def init_database(app):
     """
     Initialize the database with the Flask app.
@@ -34,8 +174,17 @@ def init_database(app):
     
     # Create all tables
     with app.app_context():
+        event.listen(db.engine, 'connect', enable_foreign_keys)
         db.create_all()
         print("Database tables created successfully!")
+        
+        # Bring tables from older databases up to date
+        with db.engine.connect() as connection:
+            upgrade_schema(connection)
+        
+        # The skill catalog's version counter is a single row
+        with db.engine.begin() as connection:
+            connection.exec_driver_sql('INSERT OR IGNORE INTO catalog_version (id, version) VALUES (1, 0)')
 
 def seed_sample_data(app):
     """
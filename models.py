@@ -10,6 +10,9 @@ Design Decisions:
 - Skills have three states: "To Learn", "In Progress", "Learned"
 - StudyLogs are separate entities linked to skills via many-to-many relationship
 - This allows tracking multiple skills per study session
+- Links are removed by ON DELETE CASCADE in the database (foreign keys are
+  enforced, see database.py), so deleting a skill or log never loads the
+  other side of the relationship
 """
 
 from flask_sqlalchemy import SQLAlchemy
@@ -28,8 +31,16 @@ class SkillStatus(Enum):
 # Association table for many-to-many relationship between StudyLog and Skill
 # A study session can involve multiple skills, and a skill can be studied in multiple sessions
 study_skill_association = db.Table('study_skill_association',
-    db.Column('study_log_id', db.Integer, db.ForeignKey('study_log.id'), primary_key=True),
-    db.Column('skill_id', db.Integer, db.ForeignKey('skill.id'), primary_key=True)
+    db.Column('study_log_id', db.Integer, db.ForeignKey('study_log.id', ondelete='CASCADE'), primary_key=True),
+    db.Column('skill_id', db.Integer, db.ForeignKey('skill.id', ondelete='CASCADE'), primary_key=True)
+)
+
+# Single-row version counter of the skill table. Every skill write bumps it in
+# the same transaction, so all processes can tell when their in-memory skill
+# catalog (see catalog.py) is out of date
+catalog_version = db.Table('catalog_version',
+    db.Column('id', db.Integer, primary_key=True),
+    db.Column('version', db.Integer, nullable=False, default=0)
 )
 
 class Skill(db.Model):
@@ -44,6 +55,9 @@ class Skill(db.Model):
         created_at: When the skill was added
         updated_at: When the skill was last modified
     """
+    # AUTOINCREMENT: ids linked from archived logs (see archive.py) are never reused
+    __table_args__ = {'sqlite_autoincrement': True}
+    
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(200), nullable=False, unique=True)
     status = db.Column(db.Enum(SkillStatus), nullable=False, default=SkillStatus.TO_LEARN)
@@ -52,7 +66,9 @@ class Skill(db.Model):
     updated_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
     
     # Relationship: skills can be referenced in multiple study logs
-    study_logs = db.relationship('StudyLog', secondary=study_skill_association, back_populates='skills')
+    # passive_deletes: the database removes the links, the ORM doesn't load them
+    study_logs = db.relationship('StudyLog', secondary=study_skill_association, back_populates='skills',
+                                 passive_deletes=True)
     
     def to_dict(self):
         """Convert skill object to dictionary for JSON serialization."""
@@ -76,6 +92,9 @@ class StudyLog(db.Model):
         notes: Optional notes about what was accomplished
         created_at: When the log entry was created
     """
+    # AUTOINCREMENT: ids of archived logs (see archive.py) are never reused
+    __table_args__ = {'sqlite_autoincrement': True}
+    
     id = db.Column(db.Integer, primary_key=True)
     date = db.Column(db.DateTime, nullable=False)
     hours = db.Column(db.Float, nullable=False)  # Allow fractional hours like 1.5
@@ -83,15 +102,22 @@ class StudyLog(db.Model):
     created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
     
     # Relationship: a study session can involve multiple skills
-    skills = db.relationship('Skill', secondary=study_skill_association, back_populates='study_logs')
+    skills = db.relationship('Skill', secondary=study_skill_association, back_populates='study_logs',
+                             passive_deletes=True)
     
-    def to_dict(self):
-        """Convert study log object to dictionary for JSON serialization."""
+    def to_dict(self, skills=None):
+        """
+        Convert study log object to dictionary for JSON serialization.
+        
+        Args:
+            skills: Optional list of skill dicts to use instead of loading
+                the skills relationship (see catalog.serialize_logs)
+        """
         return {
             'id': self.id,
             'date': self.date.isoformat(),
             'hours': self.hours,
             'notes': self.notes,
-            'skills': [skill.to_dict() for skill in self.skills],
+            'skills': skills if skills is not None else [skill.to_dict() for skill in self.skills],
             'created_at': self.created_at.isoformat()
         }
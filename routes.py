@@ -3,6 +3,7 @@ REST API routes for the Skill Tracker app.
 
 This module defines RESTful endpoints for:
 - Skills CRUD operations (/api/skills)
+- Bulk skill updates and deletes (/api/skills/bulk-update, /api/skills/bulk-delete)
 - Study logs CRUD operations (/api/logs)
 - Statistics and analytics (/api/stats)
 
@@ -13,22 +14,47 @@ Design Decisions:
 - /api prefix to distinguish from static/template routes
 """
 
-from flask import Blueprint, request, jsonify, abort
+from flask import Blueprint, request, jsonify, abort, current_app, g
 from models import db, Skill, StudyLog, SkillStatus
+from catalog import skill_catalog, serialize_logs
+from archive import (archive_metadata, query_study_logs, archived_study_days,
+                     delete_archived_study_log)
+from singleflight import flights, single_flight
 from datetime import date, datetime, timedelta
+from urllib.parse import urlsplit
+from werkzeug.exceptions import HTTPException
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy import and_, func
+from sqlalchemy import and_, case, func
 
 # Create blueprint for API routes
 api = Blueprint('api', __name__, url_prefix='/api')
 
+# Maximum number of sub-requests accepted by /api/batch
+MAX_BATCH_SIZE = 20
+
+# Maximum number of ids accepted by the bulk skill endpoints
+MAX_BULK_IDS = 500
+
+# POST endpoints that only read data
+READ_ONLY_ENDPOINTS = {'api.batch'}
+
+@api.after_request
+def invalidate_in_flight_reads(response):
+    """Make reads after a successful write start fresh instead of joining older ones."""
+    if request.method != 'GET' and request.endpoint not in READ_ONLY_ENDPOINTS and response.status_code < 400:
+        flights.invalidate()
+    return response
+
 # === SKILLS ENDPOINTS ===
 
 @api.route('/skills', methods=['GET'])
+@single_flight
 def get_skills():
     """
     Get all skills, optionally filtered by category or status.
     
+    Served from the in-memory skill catalog (see catalog.py).
+    
     Query Parameters:
         category: Filter by skill category
         status: Filter by skill status (To Learn, In Progress, Learned)
@@ -37,27 +63,20 @@ def get_skills():
         JSON array of skill objects
     """
     try:
-        # Start with all skills
-        query = Skill.query
-        
         # Apply filters if provided
         category = request.args.get('category')
         status = request.args.get('status')
         
-        if category:
-            query = query.filter(Skill.category == category)
-        
         if status:
             try:
-                status_enum = SkillStatus(status)
-                query = query.filter(Skill.status == status_enum)
+                status = SkillStatus(status).value
             except ValueError:
                 return jsonify({'error': 'Invalid status value'}), 400
         
-        # Order by category, then by creation date
-        skills = query.order_by(Skill.category, Skill.created_at).all()
+        # Ordered by category, then by creation date
+        body = skill_catalog.filter_json(category=category, status=status)
         
-        return jsonify([skill.to_dict() for skill in skills])
+        return current_app.response_class(body, mimetype='application/json')
     
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -99,6 +118,7 @@ def create_skill():
         )
         
         db.session.add(skill)
+        skill_catalog.bump()
         db.session.commit()
         
         return jsonify(skill.to_dict()), 201
@@ -151,6 +171,7 @@ def update_skill(skill_id):
         # Update timestamp
         skill.updated_at = datetime.utcnow()
         
+        skill_catalog.bump()
         db.session.commit()
         return jsonify(skill.to_dict())
     
@@ -166,6 +187,9 @@ def delete_skill(skill_id):
     """
     Delete a skill.
     
+    Runs a single DELETE statement; the skill's study log links are removed
+    by the database (ON DELETE CASCADE), so related logs are never loaded.
+    
     Args:
         skill_id: ID of the skill to delete
     
@@ -173,8 +197,12 @@ def delete_skill(skill_id):
         Success message
     """
     try:
-        skill = Skill.query.get_or_404(skill_id)
-        db.session.delete(skill)
+        deleted = Skill.query.filter(Skill.id == skill_id).delete(synchronize_session=False)
+        
+        if not deleted:
+            return jsonify({'error': 'Skill not found'}), 404
+        
+        skill_catalog.bump()
         db.session.commit()
         
         return jsonify({'message': 'Skill deleted successfully'})
@@ -183,13 +211,154 @@ def delete_skill(skill_id):
         db.session.rollback()
         return jsonify({'error': str(e)}), 500
 
+@api.route('/skills/bulk-update', methods=['POST'])
+def bulk_update_skills():
+    """
+    Update the status and/or category of many skills in one statement.
+    
+    Expected JSON body:
+        {
+            "ids": [1, 2, 3] (optional),
+            "filter": {"category": "...", "status": "..."} (optional),
+            "changes": {"status": "Learned", "category": "Backend"}
+        }
+    
+    Skills are selected by ids, filter, or both (see select_skills).
+    
+    Returns:
+        JSON object with the number of skills updated
+    """
+    try:
+        data = request.get_json(silent=True)
+        
+        if not data or not isinstance(data.get('changes'), dict):
+            return jsonify({'error': 'Changes are required'}), 400
+        
+        changes = data['changes']
+        values = {}
+        
+        if 'status' in changes:
+            try:
+                values[Skill.status] = SkillStatus(changes['status'])
+            except ValueError:
+                return jsonify({'error': 'Invalid status value'}), 400
+        
+        if 'category' in changes:
+            category = changes['category']
+            if category is not None and not isinstance(category, str):
+                return jsonify({'error': 'Category must be a string or null'}), 400
+            values[Skill.category] = (category or '').strip() or None
+        
+        if not values:
+            return jsonify({'error': 'Only status and category can be changed in bulk'}), 400
+        
+        query, error = select_skills(data)
+        if error:
+            return jsonify({'error': error}), 400
+        
+        values[Skill.updated_at] = datetime.utcnow()
+        updated = query.update(values, synchronize_session=False)
+        skill_catalog.bump()
+        db.session.commit()
+        
+        return jsonify({'updated': updated})
+    
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+@api.route('/skills/bulk-delete', methods=['POST'])
+def bulk_delete_skills():
+    """
+    Delete many skills in one statement.
+    
+    Study log links are removed by the database (ON DELETE CASCADE).
+    
+    Expected JSON body:
+        {
+            "ids": [1, 2, 3] (optional),
+            "filter": {"category": "...", "status": "..."} (optional)
+        }
+    
+    Skills are selected by ids, filter, or both (see select_skills).
+    
+    Returns:
+        JSON object with the number of skills deleted
+    """
+    try:
+        query, error = select_skills(request.get_json(silent=True))
+        if error:
+            return jsonify({'error': error}), 400
+        
+        deleted = query.delete(synchronize_session=False)
+        skill_catalog.bump()
+        db.session.commit()
+        
+        return jsonify({'deleted': deleted})
+    
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+def select_skills(data):
+    """
+    Build the skill query for a bulk request.
+    
+    The filter takes the same category and status values as GET /api/skills.
+    When both ids and a filter are given, skills must match both. A request
+    without ids or filter is rejected so it never touches every skill by
+    accident, and an empty id list selects no skills.
+    
+    Args:
+        data: Request JSON with "ids" and/or "filter"
+    
+    Returns:
+        Tuple of (query, error message or None)
+    """
+    if not isinstance(data, dict):
+        return None, 'No data provided'
+    
+    ids = data.get('ids')
+    skill_filter = data.get('filter') or {}
+    
+    if ids is not None and (not isinstance(ids, list) or
+                            not all(isinstance(i, int) and not isinstance(i, bool) for i in ids)):
+        return None, 'ids must be a list of skill IDs'
+    if ids is not None and len(ids) > MAX_BULK_IDS:
+        return None, f'At most {MAX_BULK_IDS} ids per request'
+    if not isinstance(skill_filter, dict):
+        return None, 'filter must be an object'
+    
+    category = skill_filter.get('category')
+    status = skill_filter.get('status')
+    
+    if ids is None and not category and not status:
+        return None, 'Select skills by ids or filter'
+    
+    query = Skill.query
+    if ids is not None:
+        query = query.filter(Skill.id.in_(ids))  # An empty list matches nothing
+    if category:
+        query = query.filter(Skill.category == category)
+    if status:
+        try:
+            query = query.filter(Skill.status == SkillStatus(status))
+        except ValueError:
+            return None, 'Invalid status value'
+    
+    return query, None
+
 # === STUDY LOGS ENDPOINTS ===
 
 @api.route('/logs', methods=['GET'])
+@single_flight
 def get_study_logs():
     """
     Get all study logs, ordered by date (most recent first).
     
+    Archived logs are included when the requested range or page reaches
+    back past the archive horizon (see archive.py).
+    
     Query Parameters:
         limit: Maximum number of logs to return (default: 50)
         offset: Number of logs to skip (for pagination)
@@ -200,29 +369,21 @@ def get_study_logs():
         JSON array of study log objects
     """
     try:
-        # Start with all logs
-        query = StudyLog.query
-        
         # Date range filtering
         date_from = request.args.get('date_from')
         date_to = request.args.get('date_to')
         
-        if date_from:
-            date_from_obj = datetime.strptime(date_from, '%Y-%m-%d').date()
-            query = query.filter(StudyLog.date >= date_from_obj)
-        
-        if date_to:
-            date_to_obj = datetime.strptime(date_to, '%Y-%m-%d').date()
-            query = query.filter(StudyLog.date <= date_to_obj)
+        date_from_obj = datetime.strptime(date_from, '%Y-%m-%d').date() if date_from else None
+        date_to_obj = datetime.strptime(date_to, '%Y-%m-%d').date() if date_to else None
         
         # Pagination
         limit = min(int(request.args.get('limit', 50)), 100)  # Cap at 100
         offset = int(request.args.get('offset', 0))
         
         # Order by date (most recent first) and apply pagination
-        logs = query.order_by(StudyLog.date.desc()).limit(limit).offset(offset).all()
+        logs = query_study_logs(date_from_obj, date_to_obj, limit, offset)
         
-        return jsonify([log.to_dict() for log in logs])
+        return jsonify(logs)
     
     except ValueError as e:
         return jsonify({'error': 'Invalid date format or parameter'}), 400
@@ -306,7 +467,14 @@ def delete_study_log(log_id):
         Success message
     """
     try:
-        log = StudyLog.query.get_or_404(log_id)
+        log = db.session.get(StudyLog, log_id)
+        
+        if log is None:
+            # Older logs may have been moved to an archive database
+            if delete_archived_study_log(log_id):
+                return jsonify({'message': 'Study log deleted successfully'})
+            return jsonify({'error': 'Study log not found'}), 404
+        
         db.session.delete(log)
         db.session.commit()
         
@@ -319,6 +487,7 @@ def delete_study_log(log_id):
 # === STATISTICS ENDPOINTS ===
 
 @api.route('/stats', methods=['GET'])
+@single_flight
 def get_stats():
     """
     Get various statistics about study progress.
@@ -332,84 +501,256 @@ def get_stats():
         - recent_activity: Last 7 days of study activity
     """
     try:
-        today = date.today()
-        week_start = today - timedelta(days=today.weekday())  # Monday
-        month_start = today.replace(day=1)
-        
-        # Calculate daily streak
-        streak = calculate_daily_streak()
-        
-        # Weekly hours
-        weekly_hours = db.session.query(func.sum(StudyLog.hours)).filter(
-            StudyLog.date >= week_start
-        ).scalar() or 0
-        
-        # Monthly hours
-        monthly_hours = db.session.query(func.sum(StudyLog.hours)).filter(
-            StudyLog.date >= month_start
-        ).scalar() or 0
-        
-        # Skill counts by status
-        skill_counts = {}
-        for status in SkillStatus:
-            count = Skill.query.filter(Skill.status == status).count()
-            skill_counts[status.value] = count
-        
-        # Recent activity (last 7 days)
-        seven_days_ago = today - timedelta(days=6)
-        recent_logs = StudyLog.query.filter(
-            StudyLog.date >= seven_days_ago
-        ).order_by(StudyLog.date.desc()).all()
-        
-        recent_activity = []
-        for log in recent_logs:
-            recent_activity.append({
-                'date': log.date.isoformat(),
-                'hours': log.hours,
-                'skills_count': len(log.skills)
-            })
-        
-        return jsonify({
-            'daily_streak': streak,
-            'weekly_hours': float(weekly_hours),
-            'monthly_hours': float(monthly_hours),
-            'skill_counts': skill_counts,
-            'recent_activity': recent_activity
-        })
+        return jsonify(build_stats())
     
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+def build_stats(logs=None):
+    """
+    Compute the statistics returned by /api/stats.
+    
+    Skill counts come from the in-memory skill catalog. Callers that
+    already loaded the latest logs can pass them in to skip a query.
+    
+    Args:
+        logs: Optional list of the most recent study logs as dicts (newest
+            first), used for recent activity when it covers the last 7 days
+    
+    Returns:
+        Dict with the statistics described in get_stats
+    """
+    today = date.today()
+    week_start = today - timedelta(days=today.weekday())  # Monday
+    month_start = today.replace(day=1)
+    seven_days_ago = today - timedelta(days=6)
+    
+    # Calculate daily streak
+    streak = calculate_daily_streak()
+    
+    # Weekly and monthly hours in a single scan
+    weekly_hours, monthly_hours = db.session.query(
+        func.sum(case((StudyLog.date >= week_start, StudyLog.hours), else_=0)),
+        func.sum(case((StudyLog.date >= month_start, StudyLog.hours), else_=0))
+    ).filter(
+        StudyLog.date >= min(week_start, month_start)
+    ).one()
+    
+    # Skill counts by status
+    skill_counts = {status.value: 0 for status in SkillStatus}
+    skill_counts.update(skill_catalog.status_counts())
+    
+    # Recent activity (last 7 days)
+    # Reuse the given logs if they reach back past the window, otherwise query
+    if logs and logs[-1]['date'] < seven_days_ago.isoformat():
+        recent_logs = [log for log in logs if log['date'] >= seven_days_ago.isoformat()]
+    else:
+        recent_logs = serialize_logs(StudyLog.query.filter(
+            StudyLog.date >= seven_days_ago
+        ).order_by(StudyLog.date.desc()).all())
+    
+    recent_activity = []
+    for log in recent_logs:
+        recent_activity.append({
+            'date': log['date'],
+            'hours': log['hours'],
+            'skills_count': len(log['skills'])
+        })
+    
+    return {
+        'daily_streak': streak,
+        'weekly_hours': float(weekly_hours or 0),
+        'monthly_hours': float(monthly_hours or 0),
+        'skill_counts': skill_counts,
+        'recent_activity': recent_activity
+    }
+
+def build_bootstrap(log_limit=20):
+    """
+    Build the initial data embedded into index.html.
+    
+    Everything the first screens need is computed in one pass: skills come
+    from the in-memory catalog, and the first page of logs doubles as the
+    recent activity whenever it covers the last 7 days.
+    
+    Args:
+        log_limit: Number of most recent logs to include
+    
+    Returns:
+        Dict with stats, skills and logs in their API response formats
+    """
+    logs = query_study_logs(limit=log_limit)
+    
+    return {
+        'stats': build_stats(logs),
+        'skills': [record.to_dict() for record in skill_catalog.filter()],
+        'logs': logs
+    }
+
 def calculate_daily_streak():
     """
     Calculate the current daily study streak.
     
+    Only a streak that reaches back into archived years reads the
+    archived study days as well.
+    
     Returns:
         Number of consecutive days with study activity
     """
     try:
-        today = date.today()
-        streak = 0
-        current_date = today
-        
-        # Get all study dates in descending order
-        study_dates = db.session.query(StudyLog.date).distinct().order_by(StudyLog.date.desc()).all()
-        study_dates = [d[0] for d in study_dates]  # Extract dates from tuples
-        
-        if not study_dates:
-            return 0
-        
-        # Check if we studied today or yesterday (to account for not studying today yet)
-        if study_dates and (study_dates[0] == today or study_dates[0] == today - timedelta(days=1)):
-            # Start counting from the most recent study date
-            for study_date in study_dates:
-                if study_date == current_date or study_date == current_date - timedelta(days=1):
-                    streak += 1
-                    current_date = study_date - timedelta(days=1)
-                else:
-                    break
+        # Get distinct study days (not timestamps) in descending order
+        study_day = func.date(StudyLog.date)
+        study_dates = db.session.query(study_day).distinct().order_by(study_day.desc()).all()
+        study_dates = [date.fromisoformat(d[0]) for d in study_dates]  # Extract dates from tuples
+        
+        streak, current_date = count_streak(study_dates)
+        
+        # No archived day is newer than the newest archived date; the streak
+        # continues if that day is current_date or the day before
+        newest_archived = archive_metadata(current_app)['newest_date']
+        if streak and newest_archived and newest_archived.date() >= current_date - timedelta(days=1):
+            study_dates = sorted(set(study_dates) | set(archived_study_days()), reverse=True)
+            streak, current_date = count_streak(study_dates)
         
         return streak
     
     except Exception:
         return 0  # Return 0 if there's any error calculating streak
+
+def count_streak(study_dates):
+    """
+    Count consecutive study days from today or yesterday backwards.
+    
+    Args:
+        study_dates: Distinct study dates in descending order
+    
+    Returns:
+        Tuple of (streak, day before the earliest day in the streak)
+    """
+    today = date.today()
+    streak = 0
+    current_date = today
+    
+    if not study_dates:
+        return streak, current_date
+    
+    # Check if we studied today or yesterday (to account for not studying today yet)
+    if study_dates[0] == today or study_dates[0] == today - timedelta(days=1):
+        # Start counting from the most recent study date
+        for study_date in study_dates:
+            if study_date == current_date or study_date == current_date - timedelta(days=1):
+                streak += 1
+                current_date = study_date - timedelta(days=1)
+            else:
+                break
+    
+    return streak, current_date
+
+# === METRICS ENDPOINT ===
+
+@api.route('/metrics', methods=['GET'])
+def get_metrics():
+    """
+    Get runtime metrics for this process.
+    
+    Returns:
+        JSON object with:
+        - single_flight: Requests, executions and coalescing ratio of the
+          coalesced read endpoints, overall and per endpoint
+        - skill_catalog: Size, version and estimated memory use of the
+          in-memory skill catalog
+    """
+    return jsonify({
+        'single_flight': flights.metrics(),
+        'skill_catalog': skill_catalog.memory_usage()
+    })
+
+# === BATCH ENDPOINT ===
+
+@api.route('/batch', methods=['POST'])
+def batch():
+    """
+    Run several API reads in a single round trip.
+    
+    All sub-requests share this request's app context and database
+    connection, and run inside one read transaction, so they see a
+    consistent snapshot of the data. Archived logs are read from the
+    archive files through their own connections (see archive.py), which
+    only change when logs are archived or an archived log is deleted.
+    
+    Expected JSON body:
+        {
+            "requests": [
+                {"path": "/api/stats"},
+                {"path": "/api/skills?status=Learned"},
+                {"method": "GET", "path": "/api/logs?limit=5"}
+            ]
+        }
+    
+    Only GET requests to other /api endpoints are supported.
+    
+    Returns:
+        JSON object with a "responses" array in request order, each
+        {"status": <HTTP status>, "body": <JSON response body>}
+    """
+    data = request.get_json(silent=True)
+    
+    if not data or not isinstance(data.get('requests'), list):
+        return jsonify({'error': 'A list of requests is required'}), 400
+    
+    if len(data['requests']) > MAX_BATCH_SIZE:
+        return jsonify({'error': f'At most {MAX_BATCH_SIZE} requests per batch'}), 400
+    
+    try:
+        adapter = current_app.create_url_adapter(request)
+        connection = db.session.connection()
+        responses = []
+        
+        connection.exec_driver_sql('BEGIN')
+        g.in_batch = True  # Sub-requests must not join reads outside the snapshot
+        try:
+            for sub_request in data['requests']:
+                responses.append(run_batch_request(adapter, sub_request))
+        finally:
+            g.in_batch = False
+            connection.exec_driver_sql('ROLLBACK')  # Read-only, nothing to keep
+        
+        return jsonify({'responses': responses})
+    
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+def run_batch_request(adapter, sub_request):
+    """
+    Dispatch one /api/batch sub-request to its view function.
+    
+    Args:
+        adapter: URL adapter bound to the batch request
+        sub_request: Dict with "path" and optional "method"
+    
+    Returns:
+        Dict with the sub-request's status code and JSON body
+    """
+    if not isinstance(sub_request, dict) or not sub_request.get('path'):
+        return {'status': 400, 'body': {'error': 'Request path is required'}}
+    
+    if str(sub_request.get('method', 'GET')).upper() != 'GET':
+        return {'status': 405, 'body': {'error': 'Only GET requests can be batched'}}
+    
+    url = urlsplit(sub_request['path'])
+    
+    try:
+        endpoint, view_args = adapter.match(url.path, method='GET')
+    except HTTPException as e:
+        return {'status': e.code, 'body': {'error': e.description}}
+    
+    if not endpoint.startswith(f'{api.name}.') or endpoint == f'{api.name}.batch':
+        return {'status': 400, 'body': {'error': 'Only API endpoints can be batched'}}
+    
+    try:
+        with current_app.test_request_context(url.path, method='GET', query_string=url.query):
+            response = current_app.make_response(current_app.view_functions[endpoint](**view_args))
+        return {'status': response.status_code, 'body': response.get_json()}
+    
+    except Exception as e:
+        return {'status': 500, 'body': {'error': str(e)}}
@@ -0,0 +1,159 @@
+"""
+Request coalescing (single-flight) for read endpoints of the Skill Tracker app.
+
+This module handles:
+- Sharing one in-flight computation between concurrent identical requests
+  (same endpoint, URL arguments and query arguments)
+- Counting requests versus actual executions to report the coalescing ratio
+
+Design Decisions:
+- Only in-flight work is shared; nothing is cached once it completes, so
+  a request never sees data older than the moment it arrived
+- Every write bumps a generation that is part of the key, so requests made
+  after a write never join a computation that started before it
+- The leader's response body is shared, and each waiter gets its own
+  Response object built from it
+- Built on threading primitives, which covers the threaded dev server and
+  WSGI servers, ASGI adapters that run WSGI apps in a thread pool, and
+  gevent/eventlet workers (which monkey-patch threading to be cooperative)
+"""
+
+import threading
+from functools import wraps
+
+from flask import current_app, g, request
+
+class _Flight:
+    """One in-flight computation and the outcome its waiters receive."""
+
+    __slots__ = ('done', 'result', 'error')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+class SingleFlight:
+    """
+    Group of in-flight computations keyed by request identity.
+
+    Usage:
+        flights = SingleFlight()
+        result = flights.do(key, compute)  # compute() runs once per key at a time
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flights = {}
+        self._generation = 0
+        self._counters = {}  # name -> [requests, executions]
+
+    @property
+    def generation(self):
+        return self._generation
+
+    def invalidate(self):
+        """Start a new generation so later requests don't join older computations."""
+        with self._lock:
+            self._generation += 1
+
+    def do(self, key, compute, name=None):
+        """
+        Run `compute` unless an identical call is in flight, then share its result.
+
+        Args:
+            key: Hashable identity of the computation
+            compute: Zero-argument callable producing the result
+            name: Label the call is counted under in metrics()
+
+        Returns:
+            The result of `compute` (from this call or the one already running)
+        """
+        with self._lock:
+            flight = self._flights.get(key)
+            is_leader = flight is None
+            if is_leader:
+                flight = self._flights[key] = _Flight()
+
+            counters = self._counters.setdefault(name, [0, 0])
+            counters[0] += 1
+            if is_leader:
+                counters[1] += 1
+
+        if not is_leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        try:
+            flight.result = compute()
+        except Exception as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+
+        return flight.result
+
+    def metrics(self):
+        """
+        Get request, execution and coalescing counts.
+
+        Returns:
+            Dict with overall totals and a per-endpoint breakdown. The
+            coalescing ratio is the share of requests that were served
+            by another request's computation.
+        """
+        with self._lock:
+            counters = {name: list(values) for name, values in self._counters.items()}
+            in_flight = len(self._flights)
+
+        def summarize(requests, executions):
+            return {
+                'requests': requests,
+                'executions': executions,
+                'coalesced': requests - executions,
+                'coalescing_ratio': round((requests - executions) / requests, 4) if requests else 0.0
+            }
+
+        return {
+            **summarize(sum(c[0] for c in counters.values()), sum(c[1] for c in counters.values())),
+            'in_flight': in_flight,
+            'endpoints': {name: summarize(*values) for name, values in sorted(counters.items())}
+        }
+
+# Shared by all coalesced endpoints of this process
+flights = SingleFlight()
+
+def single_flight(view):
+    """
+    Decorator coalescing concurrent identical GET requests to a view.
+
+    Requests are identical when they hit the same endpoint with the same URL
+    and query arguments (query argument order doesn't matter).
+    Sub-requests of /api/batch bypass coalescing so they keep reading
+    from the batch's own snapshot.
+    """
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        if g.get('in_batch'):
+            return view(*args, **kwargs)
+
+        key = (
+            request.endpoint,
+            flights.generation,
+            tuple(sorted(kwargs.items())),
+            tuple(sorted(request.args.items(multi=True)))
+        )
+
+        def compute():
+            response = current_app.make_response(view(*args, **kwargs))
+            return response.get_data(), response.status_code, response.content_type
+
+        body, status, content_type = flights.do(key, compute, name=request.endpoint)
+        return current_app.response_class(body, status=status, content_type=content_type)
+
+    return wrapper
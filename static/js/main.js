@@ -5,6 +5,7 @@
  * 
  * Architecture:
  * - API module: Handles all server communication
+ * - Store module: Normalized, IndexedDB-backed cache with optimistic updates
  * - UI module: Manages DOM manipulation and rendering
  * - App module: Coordinates everything and handles events
  * 
@@ -24,16 +25,19 @@ const API = {
     loadingTimeout: null,
     
     // Generic fetch wrapper with error handling
+    // Pass { quiet: true } for background requests: no loading bar, no error toast
     async request(endpoint, options = {}) {
+        const { quiet = false, ...fetchOptions } = options;
+        
         try {
-            UI.showGlobalLoading(true);
+            if (!quiet) UI.showGlobalLoading(true);
             
             const config = {
                 headers: {
                     'Content-Type': 'application/json',
-                    ...options.headers
+                    ...fetchOptions.headers
                 },
-                ...options
+                ...fetchOptions
             };
             
             const response = await fetch(`${this.baseUrl}${endpoint}`, config);
@@ -46,19 +50,19 @@ const API = {
             return data;
         } catch (error) {
             console.error('API Error:', error);
-            UI.showToast(`Error: ${error.message}`, 'error');
+            if (!quiet) UI.showToast(`Error: ${error.message}`, 'error');
             throw error;
         } finally {
-            UI.showGlobalLoading(false);
+            if (!quiet) UI.showGlobalLoading(false);
         }
     },
 
     // Skills API methods
     skills: {
-        async getAll(filters = {}) {
+        async getAll(filters = {}, options = {}) {
             const params = new URLSearchParams(filters);
             const queryString = params.toString() ? `?${params.toString()}` : '';
-            return API.request(`/skills${queryString}`);
+            return API.request(`/skills${queryString}`, options);
         },
         
         async create(skillData) {
@@ -84,10 +88,10 @@ const API = {
 
     // Study logs API methods
     logs: {
-        async getAll(filters = {}) {
+        async getAll(filters = {}, options = {}) {
             const params = new URLSearchParams(filters);
             const queryString = params.toString() ? `?${params.toString()}` : '';
-            return API.request(`/logs${queryString}`);
+            return API.request(`/logs${queryString}`, options);
         },
         
         async create(logData) {
@@ -105,8 +109,445 @@ const API = {
     },
 
     // Statistics API
-    async getStats() {
-        return API.request('/stats');
+    async getStats(options = {}) {
+        return API.request('/stats', options);
+    },
+    
+    // Several GET requests in one round trip (and one loading bar cycle).
+    // Resolves to [{ status, body }] in the same order as the endpoints.
+    async batch(endpoints, options = {}) {
+        const data = await API.request('/batch', {
+            method: 'POST',
+            body: JSON.stringify({ requests: endpoints.map(endpoint => ({ path: `${API.baseUrl}${endpoint}` })) }),
+            ...options
+        });
+        return data.responses;
+    }
+};
+
+// === STORE MODULE ===
+// Normalized client-side cache of server data (skills and logs keyed by id),
+// persisted to IndexedDB so sections render instantly, even after a reload.
+// Reads are served from here and revalidated against the server in the background;
+// writes are applied optimistically and rolled back if the server rejects them.
+const Store = {
+    dbName: 'skill-tracker',
+    dbVersion: 1,
+    db: null,
+    
+    skills: new Map(),
+    logs: new Map(),
+    stats: null,
+    
+    logPageSize: 20,
+    staleAfter: 30000,          // ms before a collection is refetched on access
+    fetchedAt: { skills: 0, logs: 0, stats: 0 },
+    inflight: {},               // one shared request per collection
+    listeners: {},
+    nextTempId: -1,             // negative ids mark optimistic, unsaved records
+    
+    // Local writes per collection: a counter bumped when a write starts and
+    // when it settles, and the number still waiting for the server
+    mutations: { skills: 0, logs: 0, stats: 0 },
+    pending: { skills: 0, logs: 0, stats: 0 },
+    
+    // Open IndexedDB and load persisted records; falls back to a memory-only
+    // cache without IndexedDB. With loadPersisted off (the page already
+    // supplied fresh data), the in-memory records are written out instead.
+    async init({ loadPersisted = true } = {}) {
+        try {
+            this.db = await this.openDatabase();
+            
+            if (!loadPersisted) {
+                this.persist('skills', { clear: true, put: [...this.skills.values()] });
+                this.persist('logs', { clear: true, put: [...this.logs.values()] });
+                if (this.stats) this.persist('meta', { put: [{ key: 'stats', value: this.stats }] });
+                return;
+            }
+            
+            const [skills, logs, meta] = await Promise.all([
+                this.readAll('skills'),
+                this.readAll('logs'),
+                this.readAll('meta')
+            ]);
+            
+            skills.forEach(skill => this.skills.set(skill.id, skill));
+            logs.forEach(log => this.logs.set(log.id, log));
+            
+            const stats = meta.find(entry => entry.key === 'stats');
+            if (stats) this.stats = stats.value;
+        } catch (error) {
+            console.warn('Store persistence disabled:', error);
+            this.db = null;
+        }
+    },
+    
+    openDatabase() {
+        return new Promise((resolve, reject) => {
+            if (!window.indexedDB) {
+                reject(new Error('IndexedDB is not supported'));
+                return;
+            }
+            
+            const request = indexedDB.open(this.dbName, this.dbVersion);
+            
+            request.onupgradeneeded = () => {
+                const db = request.result;
+                db.createObjectStore('skills', { keyPath: 'id' });
+                db.createObjectStore('logs', { keyPath: 'id' });
+                db.createObjectStore('meta', { keyPath: 'key' });
+            };
+            request.onsuccess = () => resolve(request.result);
+            request.onerror = () => reject(request.error);
+        });
+    },
+    
+    readAll(storeName) {
+        return new Promise((resolve, reject) => {
+            const request = this.db.transaction(storeName, 'readonly').objectStore(storeName).getAll();
+            request.onsuccess = () => resolve(request.result);
+            request.onerror = () => reject(request.error);
+        });
+    },
+    
+    // Write-through to IndexedDB. Failures only cost persistence, never the UI.
+    persist(storeName, { put = [], remove = [], clear = false } = {}) {
+        if (!this.db) return;
+        
+        try {
+            const tx = this.db.transaction(storeName, 'readwrite');
+            const objectStore = tx.objectStore(storeName);
+            
+            if (clear) objectStore.clear();
+            // Optimistic records are never persisted; the server copy replaces them
+            put.filter(record => !(record.id < 0)).forEach(record => objectStore.put(record));
+            remove.forEach(key => objectStore.delete(key));
+            
+            tx.onerror = () => console.warn(`Store: failed to persist ${storeName}`, tx.error);
+        } catch (error) {
+            console.warn(`Store: failed to persist ${storeName}`, error);
+        }
+    },
+    
+    // Change notification so the UI can re-render from the store
+    subscribe(collection, callback) {
+        (this.listeners[collection] = this.listeners[collection] || []).push(callback);
+    },
+    
+    notify(collection) {
+        (this.listeners[collection] || []).forEach(callback => callback());
+    },
+    
+    hasData(collection) {
+        if (collection === 'stats') return this.stats !== null;
+        return this[collection].size > 0 || this.fetchedAt[collection] > 0;
+    },
+    
+    isStale(collection) {
+        return Date.now() - this.fetchedAt[collection] > this.staleAfter;
+    },
+    
+    invalidate(...collections) {
+        collections.forEach(collection => { this.fetchedAt[collection] = 0; });
+    },
+    
+    beginMutation(...collections) {
+        collections.forEach(collection => {
+            this.mutations[collection]++;
+            this.pending[collection]++;
+        });
+    },
+    
+    endMutation(...collections) {
+        collections.forEach(collection => {
+            this.mutations[collection]++;
+            this.pending[collection]--;
+        });
+    },
+    
+    // A fetch that overlapped a local write may carry data from before it.
+    // Applying it would undo the write on screen, so its result is dropped
+    // and the collection stays stale.
+    mutatedSince(collection, version) {
+        return this.pending[collection] > 0 || this.mutations[collection] !== version;
+    },
+    
+    // API endpoint and store update for each collection
+    sources: {
+        skills: { endpoint: () => '/skills', apply: data => Store.replaceSkills(data) },
+        logs: { endpoint: () => `/logs?limit=${Store.logPageSize}`, apply: data => Store.replaceLogs(data) },
+        stats: { endpoint: () => '/stats', apply: data => Store.setStats(data) }
+    },
+    
+    // Refetch a collection if it is stale. Concurrent callers share one request.
+    // Resolves to true when the store was refreshed from the server.
+    revalidate(collection, { force = false } = {}) {
+        if (!force && !this.isStale(collection)) return Promise.resolve(false);
+        if (this.inflight[collection]) return this.inflight[collection];
+        
+        // Only show loading feedback when there is nothing cached to display
+        const options = { quiet: this.hasData(collection) };
+        const source = this.sources[collection];
+        const version = this.mutations[collection];
+        
+        this.inflight[collection] = API.request(source.endpoint(), options)
+            .then(data => {
+                if (this.mutatedSince(collection, version)) return false;
+                
+                source.apply(data);
+                this.fetchedAt[collection] = Date.now();
+                this.notify(collection);
+                return true;
+            })
+            .finally(() => {
+                delete this.inflight[collection];
+            });
+        
+        return this.inflight[collection];
+    },
+    
+    // Refetch every stale collection in a single /api/batch round trip
+    revalidateMany(collections) {
+        const stale = collections.filter(collection => this.isStale(collection) && !this.inflight[collection]);
+        if (stale.length <= 1) {
+            return Promise.all(stale.map(collection => this.revalidate(collection)));
+        }
+        
+        const versions = stale.map(collection => this.mutations[collection]);
+        const request = API.batch(stale.map(collection => this.sources[collection].endpoint()), { quiet: true })
+            .then(responses => {
+                responses.forEach((response, index) => {
+                    const collection = stale[index];
+                    if (response.status !== 200 || this.mutatedSince(collection, versions[index])) return;
+                    this.sources[collection].apply(response.body);
+                    this.fetchedAt[collection] = Date.now();
+                    this.notify(collection);
+                });
+            })
+            .finally(() => {
+                stale.forEach(collection => delete this.inflight[collection]);
+            });
+        
+        stale.forEach(collection => { this.inflight[collection] = request; });
+        return request;
+    },
+    
+    // === Selectors ===
+    
+    // Mirrors the server ordering: category (empty first), then creation date
+    getSkills(filters = {}) {
+        return [...this.skills.values()]
+            .filter(skill => !filters.category || skill.category === filters.category)
+            .filter(skill => !filters.status || skill.status === filters.status)
+            .sort((a, b) => (a.category || '').localeCompare(b.category || '') ||
+                            a.created_at.localeCompare(b.created_at));
+    },
+    
+    getLogs(limit = this.logPageSize) {
+        return [...this.logs.values()]
+            .sort((a, b) => b.date.localeCompare(a.date))
+            .slice(0, limit);
+    },
+    
+    // === Record updates ===
+    
+    putSkill(skill) {
+        this.skills.set(skill.id, skill);
+        this.persist('skills', { put: [skill] });
+    },
+    
+    removeSkill(id) {
+        this.skills.delete(id);
+        this.persist('skills', { remove: [id] });
+    },
+    
+    replaceSkills(skills) {
+        this.skills = new Map(skills.map(skill => [skill.id, skill]));
+        this.persist('skills', { clear: true, put: skills });
+    },
+    
+    putLog(log) {
+        this.logs.set(log.id, log);
+        this.persist('logs', { put: [log] });
+    },
+    
+    removeLog(id) {
+        this.logs.delete(id);
+        this.persist('logs', { remove: [id] });
+    },
+    
+    // Logs are cached as the most recent page, which is all the UI displays
+    replaceLogs(logs) {
+        this.logs = new Map(logs.map(log => [log.id, log]));
+        this.persist('logs', { clear: true, put: logs });
+    },
+    
+    setStats(stats) {
+        this.stats = stats;
+        this.persist('meta', { put: [{ key: 'stats', value: stats }] });
+    },
+    
+    // Load the data index.html was rendered with. It is as fresh as a
+    // revalidation, so the first screens need no API calls at all.
+    hydrateFromPage() {
+        const element = document.getElementById('bootstrap-data');
+        if (!element) return false;
+        
+        try {
+            const bootstrap = JSON.parse(element.textContent);
+            this.replaceSkills(bootstrap.skills);
+            this.replaceLogs(bootstrap.logs);
+            this.setStats(bootstrap.stats);
+            
+            const now = Date.now();
+            Object.keys(this.fetchedAt).forEach(collection => { this.fetchedAt[collection] = now; });
+            return true;
+        } catch (error) {
+            console.warn('Ignoring invalid bootstrap data:', error);
+            return false;
+        }
+    },
+    
+    // === Optimistic mutations ===
+    // Each applies the change locally first, then replaces it with the object the
+    // server returns. On error the previous state is restored and the error re-thrown.
+    // Every collection a write affects is marked as mutated (see mutatedSince).
+    
+    async createSkill(skillData) {
+        const now = new Date().toISOString();
+        const tempId = this.nextTempId--;
+        
+        this.beginMutation('skills', 'stats');
+        this.putSkill({
+            id: tempId,
+            name: skillData.name,
+            category: skillData.category || null,
+            status: skillData.status || 'To Learn',
+            created_at: now,
+            updated_at: now
+        });
+        this.notify('skills');
+        
+        try {
+            const skill = await API.skills.create(skillData);
+            this.removeSkill(tempId);
+            this.putSkill(skill);
+            this.invalidate('stats');
+            return skill;
+        } catch (error) {
+            this.removeSkill(tempId);
+            throw error;
+        } finally {
+            this.endMutation('skills', 'stats');
+            this.notify('skills');
+        }
+    },
+    
+    async updateSkill(id, skillData) {
+        const previous = this.skills.get(id);
+        
+        this.beginMutation('skills', 'logs', 'stats');
+        if (previous) {
+            this.putSkill({
+                ...previous,
+                ...skillData,
+                category: skillData.category || null,
+                updated_at: new Date().toISOString()
+            });
+            this.notify('skills');
+        }
+        
+        try {
+            const skill = await API.skills.update(id, skillData);
+            this.putSkill(skill);
+            // Logs embed skill snapshots and stats count statuses
+            this.invalidate('logs', 'stats');
+            return skill;
+        } catch (error) {
+            if (previous) this.putSkill(previous);
+            throw error;
+        } finally {
+            this.endMutation('skills', 'logs', 'stats');
+            this.notify('skills');
+        }
+    },
+    
+    async deleteSkill(id) {
+        const previous = this.skills.get(id);
+        
+        this.beginMutation('skills', 'logs', 'stats');
+        this.removeSkill(id);
+        this.notify('skills');
+        
+        try {
+            const result = await API.skills.delete(id);
+            this.invalidate('logs', 'stats');
+            return result;
+        } catch (error) {
+            if (previous) {
+                this.putSkill(previous);
+                this.notify('skills');
+            }
+            throw error;
+        } finally {
+            this.endMutation('skills', 'logs', 'stats');
+        }
+    },
+    
+    async createLog(logData) {
+        const tempId = this.nextTempId--;
+        
+        // The server stamps the chosen date with the current time of day
+        const now = new Date();
+        const time = now.toTimeString().split(' ')[0];
+        
+        this.beginMutation('logs', 'stats');
+        this.putLog({
+            id: tempId,
+            date: `${logData.date}T${time}`,
+            hours: logData.hours,
+            notes: logData.notes || null,
+            skills: (logData.skill_ids || []).map(id => this.skills.get(id)).filter(Boolean),
+            created_at: now.toISOString()
+        });
+        this.notify('logs');
+        
+        try {
+            const log = await API.logs.create(logData);
+            this.removeLog(tempId);
+            this.putLog(log);
+            this.invalidate('stats');
+            return log;
+        } catch (error) {
+            this.removeLog(tempId);
+            throw error;
+        } finally {
+            this.endMutation('logs', 'stats');
+            this.notify('logs');
+        }
+    },
+    
+    async deleteLog(id) {
+        const previous = this.logs.get(id);
+        
+        this.beginMutation('logs', 'stats');
+        this.removeLog(id);
+        this.notify('logs');
+        
+        try {
+            const result = await API.logs.delete(id);
+            // The cached page is now one short; refill it on next access
+            this.invalidate('logs', 'stats');
+            return result;
+        } catch (error) {
+            if (previous) {
+                this.putLog(previous);
+                this.notify('logs');
+            }
+            throw error;
+        } finally {
+            this.endMutation('logs', 'stats');
+        }
     }
 };
 
@@ -159,37 +600,63 @@ const UI = {
     },
 
     // Dashboard rendering
+    // Cached stats are shown immediately; skeletons only appear on a cold cache
     async loadDashboard() {
         try {
-            // Show skeleton loading for stats
-            this.showStatsSkeleton(true);
-            
-            const stats = await API.getStats();
-            
-            // Hide skeleton and update stat cards
-            this.showStatsSkeleton(false);
-            document.getElementById('daily-streak').textContent = stats.daily_streak;
-            document.getElementById('weekly-hours').textContent = stats.weekly_hours.toFixed(1);
-            document.getElementById('monthly-hours').textContent = stats.monthly_hours.toFixed(1);
-            document.getElementById('skills-learned').textContent = stats.skill_counts['Learned'] || 0;
+            if (Store.hasData('stats')) {
+                this.renderStats(Store.stats);
+            } else {
+                this.showStatsSkeleton(true);
+            }
             
-            // Render recent activity
-            this.renderRecentActivity(stats.recent_activity);
+            await Store.revalidate('stats');
         } catch (error) {
             console.error('Error loading dashboard:', error);
             this.showStatsSkeleton(false);
         }
     },
     
+    renderStats(stats) {
+        if (!stats) return;
+        
+        // Hide skeleton and update stat cards
+        this.showStatsSkeleton(false);
+        document.getElementById('daily-streak').textContent = stats.daily_streak;
+        document.getElementById('weekly-hours').textContent = stats.weekly_hours.toFixed(1);
+        document.getElementById('monthly-hours').textContent = stats.monthly_hours.toFixed(1);
+        document.getElementById('skills-learned').textContent = stats.skill_counts['Learned'] || 0;
+        
+        // Render recent activity
+        this.renderRecentActivity(stats.recent_activity);
+        
+        this.measureFirstPaint();
+    },
+    
+    // Time to first meaningful paint: navigation start until the stats
+    // are first on screen. Recorded as a performance mark and logged.
+    measureFirstPaint() {
+        if (this.firstPaintMeasured) return;
+        this.firstPaintMeasured = true;
+        
+        requestAnimationFrame(() => {
+            performance.mark('first-meaningful-paint');
+            console.log(`📊 Dashboard painted ${performance.now().toFixed(0)}ms after navigation start`);
+        });
+    },
+    
     showStatsSkeleton(show) {
         const statsGrid = document.querySelector('.stats-grid');
         if (show) {
+            // Keep the stat cards so they can be restored once data arrives
+            this.statsGridMarkup = this.statsGridMarkup || statsGrid.innerHTML;
             statsGrid.innerHTML = Array(4).fill(0).map(() => `
                 <div class="skeleton-stat-card" role="status" aria-busy="true" aria-label="Loading statistics">
                     <div class="skeleton skeleton-stat-number"></div>
                     <div class="skeleton skeleton-stat-label"></div>
                 </div>
             `).join('');
+        } else if (this.statsGridMarkup && !document.getElementById('daily-streak')) {
+            statsGrid.innerHTML = this.statsGridMarkup;
         }
     },
     
@@ -227,22 +694,28 @@ const UI = {
     },
 
     // Skills rendering
+    // Filtering happens client-side against the store, so filter changes are instant
     async loadSkills() {
         try {
-            // Show skeleton loading
-            this.showSkillsSkeleton(true);
-            
-            const filters = this.getSkillFilters();
-            const skills = await API.skills.getAll(filters);
+            if (Store.hasData('skills')) {
+                this.renderSkillsFromStore();
+            } else {
+                this.showSkillsSkeleton(true);
+            }
             
-            this.renderSkills(skills, filters);
-            this.updateCategoryFilter(skills);
+            await Store.revalidate('skills');
         } catch (error) {
             console.error('Error loading skills:', error);
             this.showSkillsSkeleton(false);
         }
     },
     
+    renderSkillsFromStore() {
+        const filters = this.getSkillFilters();
+        this.renderSkills(Store.getSkills(filters), filters);
+        this.updateCategoryFilter(Store.getSkills());
+    },
+    
     showSkillsSkeleton(show) {
         const container = document.getElementById('skills-container');
         if (show) {
@@ -343,11 +816,13 @@ const UI = {
     // Study logs rendering
     async loadLogs() {
         try {
-            // Show skeleton loading
-            this.showLogsSkeleton(true);
+            if (Store.hasData('logs')) {
+                this.renderLogs(Store.getLogs());
+            } else {
+                this.showLogsSkeleton(true);
+            }
             
-            const logs = await API.logs.getAll({ limit: 20 });
-            this.renderLogs(logs);
+            await Store.revalidate('logs');
         } catch (error) {
             console.error('Error loading logs:', error);
             this.showLogsSkeleton(false);
@@ -438,7 +913,13 @@ const UI = {
     // Form handling
     async populateSkillCheckboxes() {
         try {
-            const skills = await API.skills.getAll();
+            if (!Store.hasData('skills')) {
+                await Store.revalidate('skills');
+            } else {
+                Store.revalidate('skills').catch(() => {});
+            }
+            
+            const skills = Store.getSkills();
             const container = document.getElementById('skill-checkboxes');
             
             if (!skills || skills.length === 0) {
@@ -691,10 +1172,25 @@ const App = {
     currentEditingSkill: null,
     
     // Initialize the application
-    init() {
+    async init() {
         this.bindEvents();
         this.setDefaultDate();
         ThemeManager.init(); // Initialize theme management
+        
+        // Re-render on store changes
+        Store.subscribe('stats', () => UI.renderStats(Store.stats));
+        Store.subscribe('skills', () => UI.renderSkillsFromStore());
+        Store.subscribe('logs', () => UI.renderLogs(Store.getLogs()));
+        
+        // Render the data embedded in the page right away and open IndexedDB
+        // in the background. Persisted records are only needed without it.
+        if (Store.hydrateFromPage()) {
+            UI.showSection('dashboard'); // Start with dashboard
+            Store.init({ loadPersisted: false });
+            return;
+        }
+        
+        await Store.init();
         UI.showSection('dashboard'); // Start with dashboard
     },
     
@@ -714,12 +1210,19 @@ const App = {
         // Form submissions
         this.bindFormEvents();
         
-        // Filter changes
-        document.getElementById('category-filter').addEventListener('change', () => UI.loadSkills());
-        document.getElementById('status-filter').addEventListener('change', () => UI.loadSkills());
+        // Filter changes (served from the store, no request needed)
+        document.getElementById('category-filter').addEventListener('change', () => UI.renderSkillsFromStore());
+        document.getElementById('status-filter').addEventListener('change', () => UI.renderSkillsFromStore());
         
         // Theme toggle
         document.getElementById('theme-toggle').addEventListener('click', () => ThemeManager.toggleTheme());
+        
+        // Coming back to the tab: refresh whatever went stale in one request
+        document.addEventListener('visibilitychange', () => {
+            if (document.visibilityState === 'visible') {
+                Store.revalidateMany(['stats', 'skills', 'logs']).catch(() => {});
+            }
+        });
     },
     
     bindModalEvents() {
@@ -769,8 +1272,7 @@ const App = {
     
     async editSkill(skillId) {
         try {
-            const skills = await API.skills.getAll();
-            const skill = skills.find(s => s.id === skillId);
+            const skill = Store.skills.get(skillId);
             
             if (!skill) {
                 UI.showToast('Skill not found', 'error');
@@ -820,13 +1322,14 @@ const App = {
             // Show loading state
             UI.setFormLoading(form, submitBtn, true);
             
+            // The skills list updates immediately; the store reconciles with the server
             if (this.currentEditingSkill) {
                 // Update existing skill
-                await API.skills.update(this.currentEditingSkill.id, skillData);
+                await Store.updateSkill(this.currentEditingSkill.id, skillData);
                 UI.showToast('Skill updated successfully', 'success');
             } else {
                 // Create new skill
-                await API.skills.create(skillData);
+                await Store.createSkill(skillData);
                 UI.showToast('Skill added successfully', 'success');
             }
             
@@ -834,7 +1337,6 @@ const App = {
             await UI.showSuccessAnimation(submitBtn);
             
             UI.hideModal('skill-modal');
-            UI.loadSkills(); // Reload skills list
         } catch (error) {
             // Error already shown by API module
             UI.setFormLoading(form, submitBtn, false);
@@ -847,9 +1349,8 @@ const App = {
         }
         
         try {
-            await API.skills.delete(skillId);
+            await Store.deleteSkill(skillId);
             UI.showToast('Skill deleted successfully', 'success');
-            UI.loadSkills();
         } catch (error) {
             // Error already shown by API module
         }
@@ -918,14 +1419,13 @@ const App = {
             // Show loading state
             UI.setFormLoading(form, submitBtn, true);
             
-            await API.logs.create(logData);
+            await Store.createLog(logData);
             UI.showToast('Study session logged successfully', 'success');
             
             // Show success animation
             await UI.showSuccessAnimation(submitBtn);
             
             UI.hideModal('log-modal');
-            UI.loadLogs();
             
             // Refresh dashboard if it's currently visible
             const dashboardSection = document.getElementById('dashboard');
@@ -944,9 +1444,8 @@ const App = {
         }
         
         try {
-            await API.logs.delete(logId);
+            await Store.deleteLog(logId);
             UI.showToast('Study log deleted successfully', 'success');
-            UI.loadLogs();
             
             // Refresh dashboard if it's currently visible
             const dashboardSection = document.getElementById('dashboard');